@@ -3,14 +3,22 @@
 Module for concatenating two strings.
 
 This module provides a function to concatenate two strings and return
-the result.
+the result, and a rope type that `concat` can build up without copying the
+text on every call.
 """
 
+from bisect import bisect_right
+from itertools import islice
+from typing import Iterable, List, TextIO, Union
+
 
 def concat(str1: str, str2: str) -> str:
     """
     Concatenates two strings.
 
+    When either argument is a `Rope`, the result is a `Rope` that shares the
+    pieces of its input, so calling `concat` in a loop stays linear.
+
     Parameters:
     str1 (str): The first string to concatenate.
     str2 (str): The second string to concatenate.
@@ -25,5 +33,161 @@ def concat(str1: str, str2: str) -> str:
 
     >>> concat("foo", "bar")
     'foobar'
+
+    >>> str(concat(Rope("foo"), "bar"))
+    'foobar'
     """
     return str1 + str2
+
+
+class Rope:
+    """
+    A string built from a list of pieces that are only joined when the text
+    is needed.
+
+    Appending records the piece and its end offset, which is amortised O(1).
+    Ropes returned by `+` share their piece list with the rope they came from
+    and only copy it when two ropes grow from the same point, so `rope + s`
+    does not change `rope`. Slicing finds the pieces it needs by binary
+    search, and `write_to` streams the pieces without building the string.
+    """
+
+    __slots__ = ('_pieces', '_ends', '_count', '_text')
+
+    def __init__(self, text: Union[str, Iterable[str]] = "") -> None:
+        """
+        Parameters:
+        text (Union[str, Iterable[str]], optional): The initial text, or an
+        iterable of pieces. Defaults to the empty string.
+        """
+        self._pieces: List[str] = []
+        self._ends: List[int] = []
+        self._count = 0
+        self._text = None
+        for piece in ([text] if isinstance(text, str) else text):
+            self.append(piece)
+
+    def _grow(self, piece: str) -> None:
+        """
+        Adds `piece` after the pieces of this rope, copying the shared piece
+        list first when another rope has already grown it further.
+        """
+        if len(self._pieces) != self._count:
+            self._pieces = self._pieces[:self._count]
+            self._ends = self._ends[:self._count]
+        self._pieces.append(piece)
+        self._ends.append(len(self) + len(piece))
+        self._count += 1
+        self._text = None
+
+    def _share(self) -> 'Rope':
+        """
+        Returns a rope with the same text that shares this rope's pieces.
+        """
+        rope = Rope.__new__(Rope)
+        rope._pieces, rope._ends = self._pieces, self._ends
+        rope._count, rope._text = self._count, self._text
+        return rope
+
+    def append(self, piece: Union[str, 'Rope']) -> 'Rope':
+        """
+        Appends `piece` to this rope in place.
+
+        Parameters:
+        piece (Union[str, Rope]): The text to append.
+
+        Returns:
+        Rope: This rope, so calls can be chained.
+        """
+        if isinstance(piece, Rope):
+            for part in islice(piece._pieces, piece._count):
+                self._grow(part)
+        elif not isinstance(piece, str):
+            raise TypeError("can only append str or Rope, not {}".format(
+                type(piece).__name__))
+        elif piece:
+            self._grow(piece)
+        return self
+
+    def __add__(self, other: Union[str, 'Rope']) -> 'Rope':
+        if not isinstance(other, (str, Rope)):
+            return NotImplemented
+        return self._share().append(other)
+
+    def __radd__(self, other: str) -> 'Rope':
+        if not isinstance(other, str):
+            return NotImplemented
+        return Rope(other).append(self)
+
+    def __iadd__(self, other: Union[str, 'Rope']) -> 'Rope':
+        if not isinstance(other, (str, Rope)):
+            return NotImplemented
+        return self.append(other)
+
+    def __len__(self) -> int:
+        return self._ends[self._count - 1] if self._count else 0
+
+    def __str__(self) -> str:
+        """
+        Returns the joined text and keeps it as the rope's only piece, so
+        later calls do not join again.
+        """
+        if self._text is None:
+            self._text = "".join(islice(self._pieces, self._count))
+            if self._count > 1:
+                self._pieces, self._ends = [self._text], [len(self._text)]
+                self._count = 1
+        return self._text
+
+    def __getitem__(self, index: Union[int, slice]) -> str:
+        """
+        Returns the character at `index`, or the text selected by a slice.
+        Slices with a step of 1 only touch the pieces they overlap.
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return str(self)[index]
+            return self._substring(start, stop)
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("Rope index out of range")
+        return self._substring(index, index + 1)
+
+    def _substring(self, start: int, stop: int) -> str:
+        """
+        Returns the text between offsets `start` and `stop`.
+        """
+        if start >= stop:
+            return ""
+        ends, pieces = self._ends, self._pieces
+        first = bisect_right(ends, start, 0, self._count)
+        last = bisect_right(ends, stop - 1, first, self._count)
+        offset = ends[first] - len(pieces[first])
+        text = "".join(pieces[first:last + 1])
+        return text[start - offset:stop - offset]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (str, Rope)):
+            return str(self) == str(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return "Rope({!r})".format(str(self))
+
+    def write_to(self, stream: TextIO) -> int:
+        """
+        Writes the text to a text stream piece by piece, without joining it.
+
+        Parameters:
+        stream (TextIO): A file opened in text mode.
+
+        Returns:
+        int: The number of characters written.
+        """
+        stream.writelines(islice(self._pieces, self._count))
+        return len(self)
@@ -3,11 +3,15 @@
 Module for safely accessing the first element of a sequence.
 
 This module provides a function to safely retrieve the first element of a
-sequence. If the sequence is empty, it returns `None`.
+sequence. If the sequence is empty, it returns `None`. It also provides
+functions that peek at the first element of an iterator or async iterator
+without consuming it.
 """
 
 
-from typing import Sequence, Any, Union
+from itertools import chain
+from typing import (Any, AsyncIterable, AsyncIterator, Iterable, Iterator,
+                    Sequence, Tuple, Union)
 
 
 def safe_first_element(lst: Sequence[Any]) -> Union[Any, None]:
@@ -38,3 +42,107 @@ def safe_first_element(lst: Sequence[Any]) -> Union[Any, None]:
         return lst[0]
     else:
         return None
+
+
+def peek_first(
+    iterable: Iterable[Any], default: Any = None
+) -> Tuple[Union[Any, None], Iterator[Any]]:
+    """
+    Returns the first element of any iterable together with an iterator that
+    still yields every element, the first one included.
+
+    Only the first element is read ahead; the rest of the iterable is not
+    consumed or buffered.
+
+    Parameters:
+    iterable (Iterable[Any]): Any iterable, such as a generator or a file.
+    default (Any, optional): The value returned as the first element when
+    the iterable is empty. Defaults to None.
+
+    Returns:
+    Tuple[Union[Any, None], Iterator[Any]]: The first element, or `default`,
+    and an iterator over all the elements.
+
+    Example Usage:
+    --------------
+    >>> first, stream = peek_first(n * n for n in range(4))
+    >>> first, list(stream)
+    (0, [0, 1, 4, 9])
+
+    >>> first, stream = peek_first(iter([]))
+    >>> first, list(stream)
+    (None, [])
+    """
+    iterator = iter(iterable)
+    for first in iterator:
+        return first, chain((first,), iterator)
+    return default, iterator
+
+
+class _Ready:
+    """
+    An awaitable that completes immediately with a known value.
+    """
+
+    __slots__ = ('value',)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __await__(self):
+        return self.value
+        yield
+
+
+class _PushedBack:
+    """
+    An async iterator that yields one element and then continues with the
+    wrapped async iterator, without adding a generator frame per element.
+    """
+
+    __slots__ = ('_first', '_pending', '_iterator')
+
+    def __init__(self, first: Any, iterator: AsyncIterator[Any]) -> None:
+        self._first = first
+        self._pending = True
+        self._iterator = iterator
+
+    def __aiter__(self) -> '_PushedBack':
+        return self
+
+    def __anext__(self):
+        if self._pending:
+            self._pending = False
+            first, self._first = self._first, None
+            return _Ready(first)
+        return self._iterator.__anext__()
+
+    async def aclose(self) -> None:
+        aclose = getattr(self._iterator, 'aclose', None)
+        if aclose is not None:
+            await aclose()
+
+
+async def apeek_first(
+    iterable: AsyncIterable[Any], default: Any = None
+) -> Tuple[Union[Any, None], AsyncIterator[Any]]:
+    """
+    Returns the first element of an async iterable together with an async
+    iterator that still yields every element, the first one included.
+
+    Parameters:
+    iterable (AsyncIterable[Any]): Any async iterable, such as an async
+    generator.
+    default (Any, optional): The value returned as the first element when
+    the iterable is empty. Defaults to None.
+
+    Returns:
+    Tuple[Union[Any, None], AsyncIterator[Any]]: The first element, or
+    `default`, and an async iterator over all the elements.
+    """
+    iterator = iterable.__aiter__()
+    try:
+        first = await iterator.__anext__()
+    except StopAsyncIteration:
+        return default, iterator
+    return first, _PushedBack(first, iterator)
@@ -4,13 +4,37 @@ Module for safely retrieving a value from a mapping.
 
 This module provides a function to safely get a value from a dictionary.
 If the key does not exist in the dictionary, it returns a default value.
+It also provides bulk variants that resolve many keys, or many precompiled
+nested paths, in a single call.
 """
 
-from typing import Mapping, Any, Union, TypeVar
+from itertools import repeat
+from typing import (Any, Iterable, List, Mapping, Optional, Sequence, Tuple,
+                    TypeVar, Union)
 
 # Define a type variable for the default value
 T = TypeVar('T')
 
+Path = Tuple[Any, ...]
+
+_MISSING = object()
+
+
+def _paired(items: Iterable[Any], defaults: Iterable[Any],
+            name: str) -> Tuple[Sequence[Any], Sequence[Any]]:
+    """
+    Returns `items` and `defaults` as sequences, after checking that there is
+    exactly one default per item, so results cannot silently go missing.
+    """
+    if not isinstance(items, Sequence):
+        items = list(items)
+    if not isinstance(defaults, Sequence):
+        defaults = list(defaults)
+    if len(items) != len(defaults):
+        raise ValueError("got {} defaults for {} {}".format(
+            len(defaults), len(items), name))
+    return items, defaults
+
 
 def safely_get_value(
     dct: Mapping, key: Any, default: Union[T, None] = None
@@ -30,7 +54,140 @@ def safely_get_value(
     Union[Any, T]: The value associated with the key if it exists in the
     mapping, otherwise the default value.
     """
-    if key in dct:
-        return dct[key]
+    return dct.get(key, default)
+
+
+def safely_get_values(
+    dct: Mapping, keys: Iterable[Any], default: Union[T, None] = None,
+    defaults: Optional[Iterable[Any]] = None
+) -> List[Union[Any, T]]:
+    """
+    Safely retrieves the values of many keys in one pass.
+
+    Every key costs a single hash lookup through `dct.get`, and the loop runs
+    in C through `map`.
+
+    Parameters:
+    dct (Mapping[Any, Any]): The mapping from which to retrieve the values.
+    keys (Iterable[Any]): The keys whose values are to be retrieved.
+    default (Union[T, None], optional): The value used for every missing key
+    when `defaults` is not given. Defaults to None.
+    defaults (Optional[Iterable[Any]]): Per-key default values, in the same
+    order as `keys`. A `ValueError` is raised unless there is exactly one
+    per key.
+
+    Returns:
+    List[Union[Any, T]]: The value of each key, or its default, in the order
+    of `keys`.
+
+    Example Usage:
+    --------------
+    >>> safely_get_values({"a": 1, "b": 2}, ["a", "c", "b"])
+    [1, None, 2]
+
+    >>> safely_get_values({"a": 1}, ["a", "c"], defaults=[0, 3])
+    [1, 3]
+    """
+    if defaults is None:
+        defaults = repeat(default)
+    else:
+        keys, defaults = _paired(keys, defaults, "keys")
+    return list(map(dct.get, keys, defaults))
+
+
+def compile_path(path: Union[str, Iterable[Any]], sep: str = '.') -> Path:
+    """
+    Turns a dotted string such as `"db.primary.host"` into a tuple of keys,
+    so the string is split once instead of on every lookup.
+
+    Parameters:
+    path (Union[str, Iterable[Any]]): A `sep`-separated string, or an
+    iterable of keys which is returned as a tuple.
+    sep (str, optional): The separator used in string paths.
+    Defaults to '.'.
+
+    Returns:
+    Path: The keys of the path, outermost first.
+
+    Example Usage:
+    --------------
+    >>> compile_path("db.primary.host")
+    ('db', 'primary', 'host')
+    """
+    if isinstance(path, str):
+        return tuple(path.split(sep))
+    return tuple(path)
+
+
+def safely_get_path(
+    dct: Mapping, path: Path, default: Union[T, None] = None
+) -> Union[Any, T]:
+    """
+    Safely retrieves a value nested inside mappings.
+
+    Parameters:
+    dct (Mapping[Any, Any]): The outermost mapping.
+    path (Path): The keys to follow, as returned by `compile_path`.
+    default (Union[T, None], optional): The value to return if any key along
+    the path is missing, or leads to something that is not a mapping.
+    Defaults to None.
+
+    Returns:
+    Union[Any, T]: The value at the end of the path, otherwise the default
+    value.
+
+    Example Usage:
+    --------------
+    >>> safely_get_path({"db": {"port": 5432}}, ("db", "port"))
+    5432
+    """
+    value = dct
+    for key in path:
+        try:
+            value = value.get(key, _MISSING)
+        except AttributeError:
+            return default
+        if value is _MISSING:
+            return default
+    return value
+
+
+def safely_get_paths(
+    dct: Mapping, paths: Iterable[Path], default: Union[T, None] = None,
+    defaults: Optional[Iterable[Any]] = None
+) -> List[Union[Any, T]]:
+    """
+    Safely retrieves the values at many precompiled nested paths.
+
+    Paths of a single key are resolved with one lookup, like
+    `safely_get_values`.
+
+    Parameters:
+    dct (Mapping[Any, Any]): The outermost mapping.
+    paths (Iterable[Path]): The paths to resolve, as returned by
+    `compile_path`.
+    default (Union[T, None], optional): The value used for every missing
+    path when `defaults` is not given. Defaults to None.
+    defaults (Optional[Iterable[Any]]): Per-path default values, in the same
+    order as `paths`. A `ValueError` is raised unless there is exactly one
+    per path.
+
+    Returns:
+    List[Union[Any, T]]: The value at each path, or its default, in the
+    order of `paths`.
+
+    Example Usage:
+    --------------
+    >>> config = {"db": {"host": "localhost"}, "debug": True}
+    >>> paths = [compile_path(p) for p in ("db.host", "db.port", "debug")]
+    >>> safely_get_paths(config, paths, defaults=["", 5432, False])
+    ['localhost', 5432, True]
+    """
+    if defaults is None:
+        defaults = repeat(default)
     else:
-        return default
+        paths, defaults = _paired(paths, defaults, "paths")
+    get = dct.get
+    return [get(path[0], fallback) if len(path) == 1
+            else safely_get_path(dct, path, fallback)
+            for path, fallback in zip(paths, defaults)]
@@ -3,10 +3,14 @@
 Module for zooming in on an array by repeating its elements.
 This module contains a function that takes a tuple of items and returns a list
 where each item is repeated a specified number of times. The default repetition
-factor is 2.
+factor is 2. It also provides a lazy view that computes the zoomed items on
+demand, and a function that writes a zoomed numeric tuple into a preallocated
+array.
 """
 
-from typing import Tuple, List
+from array import array as TypedArray
+from itertools import chain, repeat
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
 
 
 def zoom_array(lst: Tuple, factor: int = 2) -> List:
@@ -24,6 +28,118 @@ def zoom_array(lst: Tuple, factor: int = 2) -> List:
     return zoomed_in
 
 
+class ZoomView(Sequence):
+    """
+    A read-only sequence that behaves like `zoom_array(lst, factor)` without
+    building it.
+
+    Item `i` of the view is `lst[i // factor]`, so the view only keeps a
+    reference to `lst` and its memory use does not depend on `factor`.
+    """
+
+    __slots__ = ('_items', '_factor')
+
+    def __init__(self, lst: Sequence, factor: int = 2) -> None:
+        """
+        Parameters:
+        lst (Sequence): The elements to be repeated.
+        factor (int, optional): The number of times each element is
+        repeated. Defaults to 2.
+        """
+        if factor < 0:
+            raise ValueError("factor must not be negative")
+        self._items = lst
+        self._factor = factor
+
+    def __len__(self) -> int:
+        return len(self._items) * self._factor
+
+    def __getitem__(self, index: Union[int, slice]):
+        """
+        Returns the zoomed item at `index`, or a list of the zoomed items
+        selected by a slice.
+        """
+        if isinstance(index, slice):
+            items, factor = self._items, self._factor
+            return [items[i // factor]
+                    for i in range(*index.indices(len(self)))]
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("ZoomView index out of range")
+        return self._items[index // self._factor]
+
+    def __iter__(self) -> Iterator:
+        return chain.from_iterable(
+            map(repeat, self._items, repeat(self._factor)))
+
+    def __repr__(self) -> str:
+        return "ZoomView({!r}, {})".format(self._items, self._factor)
+
+
+def zoom_view(lst: Tuple, factor: int = 2) -> ZoomView:
+    """
+    Returns a lazy view of `lst` zoomed in by `factor`.
+
+    Parameters:
+    lst (Tuple): A tuple containing elements to be repeated.
+    factor (int, optional): The number of times each element should be
+    repeated. Defaults to 2.
+
+    Returns:
+    ZoomView: A sequence equal to `zoom_array(lst, factor)` that computes its
+    items on demand.
+
+    Example Usage:
+    --------------
+    >>> view = zoom_view((12, 72, 91), 100)
+    >>> len(view), view[250], view[98:102]
+    (300, 91, [12, 12, 72, 72])
+    """
+    return ZoomView(lst, factor)
+
+
+def zoom_into(lst: Tuple, factor: int = 2,
+              out: Optional[TypedArray] = None,
+              typecode: str = 'd') -> TypedArray:
+    """
+    Writes a numeric tuple zoomed in by `factor` into an array.
+
+    The array is filled with one strided slice assignment per repetition, so
+    the work done in Python grows with `factor`, not with the output size.
+
+    Parameters:
+    lst (Tuple): A tuple of numbers to be repeated.
+    factor (int, optional): The number of times each element should be
+    repeated. Defaults to 2.
+    out (Optional[TypedArray]): A preallocated array of `len(lst) * factor`
+    items to write into. A new array is allocated when omitted.
+    typecode (str, optional): The typecode of the allocated array when `out`
+    is omitted. Defaults to 'd'.
+
+    Returns:
+    TypedArray: `out`, or the newly allocated array, holding the zoomed
+    values.
+
+    Example Usage:
+    --------------
+    >>> zoom_into((12, 72, 91), 3, typecode='q')
+    array('q', [12, 12, 12, 72, 72, 72, 91, 91, 91])
+    """
+    size = len(lst) * factor
+    if out is None:
+        itemsize = TypedArray(typecode).itemsize
+        out = TypedArray(typecode, bytes(size * itemsize))
+    elif len(out) != size:
+        raise ValueError("out must hold {} items, not {}".format(
+            size, len(out)))
+    source = TypedArray(out.typecode, lst)
+    for offset in range(factor):
+        out[offset::factor] = source
+    return out
+
+
 # Example usage
 array = (12, 72, 91)
 
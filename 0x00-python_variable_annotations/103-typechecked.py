@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Module for enforcing function annotations at runtime.
+
+This module provides a decorator that turns the annotations of a function,
+such as those in this project, into checks run on every call. Each
+annotation is compiled once into a small predicate, and predicates are
+cached so functions with the same annotations share them. Containers are
+checked by sampling a few elements rather than scanning all of them.
+
+Checking is decided when a function is decorated: when it is disabled,
+either with `set_checking(False)`, by running Python with `-O`, or by
+setting the environment variable `ANNOTATIONS_TYPECHECK=0`, `typechecked`
+returns the original function object and calls cost nothing extra.
+"""
+
+import collections.abc
+import functools
+import inspect
+import os
+import typing
+from itertools import islice
+from typing import Any, Callable, Dict, Optional, TypeVar, Union
+
+F = TypeVar('F', bound=Callable[..., Any])
+Check = Callable[[Any], bool]
+
+SAMPLE_SIZE = 5
+"""
+The number of elements checked in a container annotated with an element
+type, such as `List[float]`.
+"""
+
+_enabled = __debug__ and os.environ.get('ANNOTATIONS_TYPECHECK', '1') != '0'
+
+_NUMERIC = {float: (int, float), complex: (int, float, complex)}
+
+_SEQUENCES = (list, tuple, collections.abc.Sequence,
+              collections.abc.MutableSequence)
+
+_SETS = (set, frozenset, collections.abc.Set, collections.abc.MutableSet)
+
+_MAPPINGS = (dict, collections.abc.Mapping, collections.abc.MutableMapping)
+
+
+def set_checking(enabled: bool) -> None:
+    """
+    Turns checking on or off for functions decorated from now on.
+
+    Parameters:
+    enabled (bool): Whether `typechecked` should wrap functions.
+    """
+    global _enabled
+    _enabled = enabled
+
+
+def checking_enabled() -> bool:
+    """
+    Returns whether `typechecked` currently wraps functions.
+
+    Returns:
+    bool: True if checking is enabled.
+    """
+    return _enabled
+
+
+def _compile(annotation: Any) -> Optional[Check]:
+    """
+    Returns a predicate for `annotation`, or None when any value is
+    accepted. Results are cached per annotation.
+    """
+    try:
+        return _compile_cached(annotation)
+    except TypeError:
+        # Unhashable annotations, such as Literal of a list, skip the cache.
+        return _compile_uncached(annotation)
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_cached(annotation: Any) -> Optional[Check]:
+    return _compile_uncached(annotation)
+
+
+def _compile_uncached(annotation: Any) -> Optional[Check]:
+    if annotation in (Any, inspect.Parameter.empty, object):
+        return None
+    if annotation is None or annotation is type(None):
+        return lambda value: value is None
+    if isinstance(annotation, (str, typing.ForwardRef)):
+        return None
+    if isinstance(annotation, TypeVar):
+        if annotation.__bound__ is not None:
+            return _compile(annotation.__bound__)
+        if annotation.__constraints__:
+            return _compile(Union[annotation.__constraints__])
+        return None
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin is None:
+        if isinstance(annotation, type):
+            kinds = _NUMERIC.get(annotation, annotation)
+            return lambda value: isinstance(value, kinds)
+        return None
+    if origin is Union:
+        checks = [_compile(arg) for arg in args]
+        if None in checks:
+            return None
+        plain = tuple(_NUMERIC.get(arg, arg) for arg in args
+                      if typing.get_origin(arg) is None
+                      and isinstance(arg, type))
+        if len(plain) == len(args):
+            kinds = tuple(_flatten(plain))
+            return lambda value: isinstance(value, kinds)
+
+        def check(value: Any) -> bool:
+            for option in checks:
+                if option(value):
+                    return True
+            return False
+        return check
+    if origin is typing.Literal:
+        return lambda value: value in args
+    if origin is collections.abc.Callable:
+        return callable
+    if origin is type:
+        if not args or not isinstance(args[0], type):
+            return lambda value: isinstance(value, type)
+        base = args[0]
+        return lambda value: (isinstance(value, type)
+                              and issubclass(value, base))
+    if not isinstance(origin, type):
+        return None
+    if origin is tuple and args and args[-1] is not Ellipsis:
+        return _compile_fixed_tuple(args)
+    if origin in _SEQUENCES and args:
+        return _compile_sequence(origin, _compile(args[0]))
+    if origin in _SETS and args:
+        return _compile_iterable(origin, _compile(args[0]))
+    if origin in _MAPPINGS and len(args) == 2:
+        return _compile_mapping(origin, _compile(args[0]), _compile(args[1]))
+    return lambda value: isinstance(value, origin)
+
+
+def _flatten(kinds):
+    """
+    Yields the classes of a tuple whose items are classes or tuples of
+    classes.
+    """
+    for kind in kinds:
+        if isinstance(kind, tuple):
+            yield from kind
+        else:
+            yield kind
+
+
+def _compile_fixed_tuple(args) -> Check:
+    """
+    Returns a predicate for `Tuple[X, Y, ...]` with a fixed length.
+    """
+    if args == ((),):
+        args = ()
+    checks = [_compile(arg) for arg in args]
+
+    def check(value: Any) -> bool:
+        if not isinstance(value, tuple) or len(value) != len(checks):
+            return False
+        for item_check, item in zip(checks, value):
+            if item_check is not None and not item_check(item):
+                return False
+        return True
+    return check
+
+
+def _compile_sequence(origin: type, item_check: Optional[Check]) -> Check:
+    """
+    Returns a predicate for a sequence type that samples its items.
+    Items are read by integer index, which every sequence supports, unlike
+    slicing, which `deque` does not.
+    """
+    if item_check is None:
+        return lambda value: isinstance(value, origin)
+
+    def check(value: Any) -> bool:
+        if not isinstance(value, origin):
+            return False
+        size = len(value)
+        for index in range(0, size, size // SAMPLE_SIZE + 1):
+            if not item_check(value[index]):
+                return False
+        return not size or item_check(value[-1])
+    return check
+
+
+def _compile_iterable(origin: type, item_check: Optional[Check]) -> Check:
+    """
+    Returns a predicate for a sized, unordered container that samples its
+    first items.
+    """
+    if item_check is None:
+        return lambda value: isinstance(value, origin)
+
+    def check(value: Any) -> bool:
+        return isinstance(value, origin) and all(
+            map(item_check, islice(value, SAMPLE_SIZE)))
+    return check
+
+
+def _compile_mapping(origin: type, key_check: Optional[Check],
+                     value_check: Optional[Check]) -> Check:
+    """
+    Returns a predicate for a mapping type that samples its first items.
+    """
+    if key_check is None and value_check is None:
+        return lambda value: isinstance(value, origin)
+
+    def check(value: Any) -> bool:
+        if not isinstance(value, origin):
+            return False
+        for key, item in islice(value.items(), SAMPLE_SIZE):
+            if key_check is not None and not key_check(key):
+                return False
+            if value_check is not None and not value_check(item):
+                return False
+        return True
+    return check
+
+
+def _describe(annotation: Any) -> str:
+    """
+    Returns a short, readable name for an annotation.
+    """
+    if isinstance(annotation, type) and typing.get_origin(annotation) is None:
+        return annotation.__name__
+    return repr(annotation).replace('typing.', '')
+
+
+def typechecked(func: F) -> F:
+    """
+    Decorates a function so its arguments and return value are checked
+    against its annotations.
+
+    Parameters:
+    func (F): The function, or coroutine function, to check.
+
+    Returns:
+    F: A wrapper that raises `TypeError` when a value does not match its
+    annotation, or `func` itself when checking is disabled.
+
+    Example Usage:
+    --------------
+    >>> @typechecked
+    ... def add(a: float, b: float) -> float:
+    ...     return a + b
+    >>> add(1, 2.5)
+    3.5
+    >>> add("1", 2.5)
+    Traceback (most recent call last):
+    ...
+    TypeError: add() argument 'a' must be float, not str
+    """
+    if not _enabled:
+        return func
+    try:
+        hints = typing.get_type_hints(func)
+    except Exception:
+        hints = dict(getattr(func, '__annotations__', {}))
+    parameters = inspect.signature(func).parameters
+    checks: Dict[str, Check] = {}
+    positional = []
+    var_positional = var_keyword = None
+    for name, parameter in parameters.items():
+        check = _compile(hints.get(name, Any))
+        if parameter.kind is parameter.VAR_POSITIONAL:
+            var_positional = (name, check)
+        elif parameter.kind is parameter.VAR_KEYWORD:
+            var_keyword = (name, check)
+        else:
+            if parameter.kind is not parameter.KEYWORD_ONLY:
+                positional.append((name, check))
+            if check is not None:
+                checks[name] = check
+    return_check = _compile(hints.get('return', Any))
+    qualname = func.__qualname__
+
+    def fail(name: str, value: Any) -> None:
+        raise TypeError("{}() argument '{}' must be {}, not {}".format(
+            qualname, name, _describe(hints[name]), type(value).__name__))
+
+    def check_arguments(args, kwargs) -> None:
+        for (name, check), value in zip(positional, args):
+            if check is not None and not check(value):
+                fail(name, value)
+        if not kwargs and len(args) <= len(positional):
+            return
+        if var_positional is not None and var_positional[1] is not None:
+            name, check = var_positional
+            for value in args[len(positional):]:
+                if not check(value):
+                    fail(name, value)
+        for name, value in kwargs.items():
+            check = checks.get(name)
+            if check is None and var_keyword is not None \
+                    and name not in parameters:
+                name, check = var_keyword
+            if check is not None and not check(value):
+                fail(name, value)
+
+    def check_result(result: Any) -> Any:
+        if return_check is not None and not return_check(result):
+            raise TypeError("{}() returned {}, expected {}".format(
+                qualname, type(result).__name__,
+                _describe(hints['return'])))
+        return result
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            check_arguments(args, kwargs)
+            return check_result(await func(*args, **kwargs))
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        check_arguments(args, kwargs)
+        return check_result(func(*args, **kwargs))
+    return wrapper
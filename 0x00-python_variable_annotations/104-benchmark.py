@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Module for benchmarking the annotation helpers of this project.
+
+This module times `add`, `concat`, `floor`, `sum_list`, `sum_mixed_list`,
+`to_kv`, `make_multiplier`, `element_length` and `zoom_array` over a range of
+input sizes. The number of calls per sample is calibrated so each sample
+lasts long enough to be measured reliably, and every result reports the
+median and the spread of several samples. Results can be saved as a JSON
+baseline, and a later run can be compared with that baseline so that any
+function that slowed down by more than a threshold fails the run.
+
+Usage:
+    ./104-benchmark.py --save baseline.json
+    ./104-benchmark.py --check baseline.json --threshold 0.25
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+from timeit import Timer
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+add = __import__('0-add').add
+concat = __import__('1-concat').concat
+floor = __import__('2-floor').floor
+sum_list = __import__('5-sum_list').sum_list
+sum_mixed_list = __import__('6-sum_mixed_list').sum_mixed_list
+to_kv = __import__('7-to_kv').to_kv
+make_multiplier = __import__('8-make_multiplier').make_multiplier
+element_length = __import__('9-element_length').element_length
+zoom_array = __import__('102-type_checking').zoom_array
+
+Result = Dict[str, float]
+
+DEFAULT_SIZES = (10, 1000, 100000)
+
+SCALAR = (1,)
+"""
+The only size used for functions whose cost does not depend on input size.
+"""
+
+
+def _case(func: Callable, args: Tuple) -> Callable[[], Any]:
+    """
+    Returns a callable with no parameters that calls `func(*args)`.
+    """
+    return lambda: func(*args)
+
+
+CASES: Dict[str, Tuple[Sequence[int], Callable[[int], Callable[[], Any]]]] = {
+    'add': (SCALAR, lambda size: _case(add, (1.5, 2.5))),
+    'concat': (DEFAULT_SIZES,
+               lambda size: _case(concat, ('a' * size, 'b' * size))),
+    'floor': (SCALAR, lambda size: _case(floor, (3.7,))),
+    'sum_list': (DEFAULT_SIZES,
+                 lambda size: _case(sum_list, ([0.5] * size,))),
+    'sum_mixed_list': (DEFAULT_SIZES, lambda size: _case(
+        sum_mixed_list, ([1, 0.5] * (size // 2),))),
+    'to_kv': (SCALAR, lambda size: _case(to_kv, ('eggs', 3))),
+    'make_multiplier': (SCALAR,
+                        lambda size: _case(make_multiplier(2.22), (2.22,))),
+    'element_length': (DEFAULT_SIZES, lambda size: _case(
+        element_length, (['Lawson'] * size,))),
+    'zoom_array': (DEFAULT_SIZES,
+                   lambda size: _case(zoom_array, (tuple(range(size)), 3))),
+}
+"""
+The benchmarked functions: the input sizes for each, and a factory that
+builds the call to time for a given size.
+"""
+
+
+def calibrate(call: Callable[[], Any], min_time: float = 0.02) -> int:
+    """
+    Returns how many calls of `call` take at least `min_time` seconds.
+
+    Parameters:
+    call (Callable[[], Any]): The function to time.
+    min_time (float, optional): The minimum duration of one sample, in
+    seconds. Defaults to 0.02.
+
+    Returns:
+    int: The number of calls per sample.
+    """
+    timer = Timer(call)
+    number = 1
+    while True:
+        if timer.timeit(number) >= min_time:
+            return number
+        number *= 2
+
+
+def measure(call: Callable[[], Any], repeat: int = 7,
+            min_time: float = 0.02) -> Result:
+    """
+    Times `call` and summarises the samples.
+
+    Parameters:
+    call (Callable[[], Any]): The function to time.
+    repeat (int, optional): The number of samples, at least 2.
+    Defaults to 7.
+    min_time (float, optional): The minimum duration of one sample, in
+    seconds. Defaults to 0.02.
+
+    Returns:
+    Result: The median time per call, the interquartile range and the
+    relative standard deviation of the samples, and the calls per sample.
+    """
+    number = calibrate(call, min_time)
+    samples = [total / number
+               for total in Timer(call).repeat(repeat, number)]
+    median = statistics.median(samples)
+    quartiles = statistics.quantiles(samples, n=4)
+    return {
+        'median': median,
+        'iqr': quartiles[2] - quartiles[0],
+        'rsd': statistics.stdev(samples) / statistics.mean(samples),
+        'number': number,
+    }
+
+
+def run(names: Optional[Sequence[str]] = None,
+        sizes: Optional[Sequence[int]] = None, repeat: int = 7,
+        min_time: float = 0.02) -> Dict[str, Result]:
+    """
+    Benchmarks the selected functions.
+
+    Parameters:
+    names (Optional[Sequence[str]]): The functions to benchmark. All of
+    them by default.
+    sizes (Optional[Sequence[int]]): The input sizes, overriding each
+    function's defaults for functions that take sized inputs.
+    repeat (int, optional): The number of samples. Defaults to 7.
+    min_time (float, optional): The minimum duration of one sample, in
+    seconds. Defaults to 0.02.
+
+    Returns:
+    Dict[str, Result]: The results keyed by `name[size]`.
+    """
+    results = {}
+    for name in names or CASES:
+        default_sizes, factory = CASES[name]
+        if sizes and default_sizes is not SCALAR:
+            default_sizes = sizes
+        for size in default_sizes:
+            key = '{}[{}]'.format(name, size)
+            results[key] = measure(factory(size), repeat, min_time)
+    return results
+
+
+def save(path: str, results: Dict[str, Result]) -> None:
+    """
+    Writes `results` to a JSON baseline file.
+
+    Parameters:
+    path (str): The path of the baseline file.
+    results (Dict[str, Result]): The results returned by `run`.
+    """
+    baseline = {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'results': results,
+    }
+    with open(path, 'w') as stream:
+        json.dump(baseline, stream, indent=2, sort_keys=True)
+
+
+def compare(results: Dict[str, Result], path: str,
+            threshold: float = 0.25) -> List[Tuple[str, float]]:
+    """
+    Compares `results` with a saved baseline.
+
+    Parameters:
+    results (Dict[str, Result]): The results returned by `run`.
+    path (str): The path of the baseline file.
+    threshold (float, optional): The allowed slowdown, as a fraction of
+    the baseline median. Defaults to 0.25.
+
+    Returns:
+    List[Tuple[str, float]]: The benchmarks slower than the threshold
+    allows, with their median time relative to the baseline.
+    """
+    with open(path) as stream:
+        baseline = json.load(stream)['results']
+    regressions = []
+    for key, result in results.items():
+        if key not in baseline:
+            continue
+        ratio = result['median'] / baseline[key]['median']
+        if ratio > 1 + threshold:
+            regressions.append((key, ratio))
+    return regressions
+
+
+def report(results: Dict[str, Result]) -> None:
+    """
+    Prints one line per result.
+
+    Parameters:
+    results (Dict[str, Result]): The results returned by `run`.
+    """
+    print('{:<26} {:>12} {:>12} {:>7} {:>10}'.format(
+        'benchmark', 'median', 'iqr', 'rsd', 'calls'))
+    for key, result in results.items():
+        print('{:<26} {:>9.3f} us {:>9.3f} us {:>6.1f}% {:>10}'.format(
+            key, result['median'] * 1e6, result['iqr'] * 1e6,
+            result['rsd'] * 100, result['number']))
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Runs the benchmarks from the command line.
+
+    Returns:
+    int: 1 if a regression was found, otherwise 0.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('names', nargs='*', metavar='name',
+                        help='functions to benchmark (default: all of {})'
+                        .format(', '.join(CASES)))
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        help='input sizes for sized benchmarks')
+    parser.add_argument('--repeat', type=int, default=7,
+                        help='samples per benchmark (default: 7)')
+    parser.add_argument('--min-time', type=float, default=0.02,
+                        help='minimum seconds per sample (default: 0.02)')
+    parser.add_argument('--save', metavar='FILE',
+                        help='write the results as a JSON baseline')
+    parser.add_argument('--check', metavar='FILE',
+                        help='fail on regressions against a JSON baseline')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='allowed slowdown before failing (default: '
+                        '0.25, i.e. 25%%)')
+    args = parser.parse_args(argv)
+    unknown = set(args.names) - set(CASES)
+    if unknown:
+        parser.error('unknown benchmark: {}'.format(
+            ', '.join(sorted(unknown))))
+    if args.repeat < 2:
+        parser.error('--repeat must be at least 2')
+    results = run(args.names, args.sizes, args.repeat, args.min_time)
+    report(results)
+    if args.save:
+        save(args.save, results)
+    if args.check:
+        regressions = compare(results, args.check, args.threshold)
+        for key, ratio in regressions:
+            print('REGRESSION {}: {:.2f}x the baseline median'.format(
+                key, ratio))
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
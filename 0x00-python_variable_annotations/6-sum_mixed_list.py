@@ -3,10 +3,16 @@
 Module for summing elements of a list containing both integers and floats.
 
 This module provides a function to take a list of mixed integers and
-floating-point numbers as input and return their sum as a float.
+floating-point numbers as input and return their sum as a float, and batch
+variants that reduce typed buffers and chunked iterables of mixed numbers
+with the block engine of `5-sum_list`.
 """
 
-from typing import List, Union
+from typing import Iterable, List, Union
+
+sum_buffer = __import__('5-sum_list').sum_buffer
+sum_chunks = __import__('5-sum_list').sum_chunks
+Buffer = __import__('5-sum_list').Buffer
 
 
 def sum_mixed_list(mxd_lst: List[Union[int, float]]) -> float:
@@ -33,3 +39,63 @@ def sum_mixed_list(mxd_lst: List[Union[int, float]]) -> float:
     12.5
     """
     return sum(mxd_lst)
+
+
+def sum_mixed_buffer(values: Union[Buffer, Iterable[Union[int, float]]],
+                     chunk_size: int = 1 << 16,
+                     compensated: bool = False) -> float:
+    """
+    Returns the sum of a buffer or iterable of integers and floats as a
+    float, reduced in blocks by `sum_buffer`.
+
+    Integer buffers such as `array('q')` are read through a memoryview like
+    float ones. In compensated mode every number is converted to a float and
+    reduced with `math.fsum`, so integers beyond 2**53 are rounded first.
+
+    Parameters:
+    values (Union[Buffer, Iterable[Union[int, float]]]): An `array`,
+    memoryview or other buffer of numbers, or a plain iterable of integers
+    and floats.
+    chunk_size (int, optional): Number of elements reduced per block.
+    Defaults to 65536.
+    compensated (bool, optional): Use an exactly rounded summation instead
+    of plain floating-point addition. Defaults to False.
+
+    Returns:
+    float: The sum of all the values.
+
+    Example Usage:
+    --------------
+    >>> sum_mixed_buffer([1, 2.5, 3, 4.0])
+    10.5
+
+    >>> sum_mixed_buffer([1, 0.1, 0.1, 0.1], compensated=True)
+    1.3
+    """
+    return sum_buffer(values, chunk_size, compensated)
+
+
+def sum_mixed_chunks(
+    chunks: Iterable[Union[Buffer, Iterable[Union[int, float]]]],
+    compensated: bool = False
+) -> float:
+    """
+    Returns the sum of a stream of chunks of integers and floats, such as
+    `array('q')` and `array('d')` blocks, with `sum_chunks`.
+
+    Parameters:
+    chunks (Iterable[Union[Buffer, Iterable[Union[int, float]]]]): An
+    iterable whose items are buffers or iterables of numbers.
+    compensated (bool, optional): Use an exactly rounded summation instead
+    of plain floating-point addition. Defaults to False.
+
+    Returns:
+    float: The sum of all the values in all the chunks.
+
+    Example Usage:
+    --------------
+    >>> from array import array
+    >>> sum_mixed_chunks([array('q', [1, 2]), array('d', [0.5]), [3]])
+    6.5
+    """
+    return sum_chunks(chunks, compensated)
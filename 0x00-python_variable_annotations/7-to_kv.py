@@ -4,10 +4,17 @@ Module for creating a tuple with a string and the square of a number.
 
 This module provides a function to take a string and a number
 (integer or float) as input and returns a tuple where the first element is the
-string and the second element is the square of the number.
+string and the second element is the square of the number. A batch variant
+stores many such pairs as a key list and an `array('d')` of squares.
 """
 
-from typing import Union, Tuple
+import csv
+import sys
+from array import array
+from itertools import chain, tee
+from operator import mul
+from struct import pack
+from typing import BinaryIO, Iterable, Iterator, List, TextIO, Tuple, Union
 
 
 def to_kv(k: str, v: Union[int, float]) -> Tuple[str, float]:
@@ -37,3 +44,93 @@ def to_kv(k: str, v: Union[int, float]) -> Tuple[str, float]:
     ('number', 16.0)
     """
     return k, v * v
+
+
+class KVColumns:
+    """
+    The pairs produced by `to_kv`, stored as two parallel columns.
+
+    Keys live in a list and squared values in an `array('d')`, so a pair
+    takes one list slot and eight bytes instead of a tuple and a float
+    object. Iterating yields `(key, value)` pairs, and the columns can be
+    written out as CSV or binary without building those pairs.
+    """
+
+    __slots__ = ('keys', 'values')
+
+    def __init__(self, keys: List[str], values: array) -> None:
+        """
+        Parameters:
+        keys (List[str]): The keys, in order.
+        values (array): The squared values, an `array('d')` of the same
+        length as `keys`.
+        """
+        if len(keys) != len(values):
+            raise ValueError("keys and values must have the same length")
+        self.keys = keys
+        self.values = values
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __iter__(self) -> Iterator[Tuple[str, float]]:
+        return zip(self.keys, self.values)
+
+    def __getitem__(self, index: int) -> Tuple[str, float]:
+        return self.keys[index], self.values[index]
+
+    def write_csv(self, stream: TextIO) -> None:
+        """
+        Writes one `key,value` row per pair to a text stream.
+
+        Parameters:
+        stream (TextIO): A file opened in text mode with `newline=''`.
+        """
+        csv.writer(stream).writerows(zip(self.keys, self.values))
+
+    def write_binary(self, stream: BinaryIO) -> None:
+        """
+        Writes the columns to a binary stream.
+
+        The whole file is little-endian, whatever the byte order of the
+        host: the pair count as an unsigned 64-bit integer, the values as
+        doubles, then each key as its UTF-8 length in an unsigned 32-bit
+        integer followed by its UTF-8 bytes, so keys may contain any
+        character. The keys are encoded and written one at a time, so no
+        encoded copy of the whole key column is held in memory.
+
+        Parameters:
+        stream (BinaryIO): A file opened in binary mode.
+        """
+        stream.write(pack('<Q', len(self.keys)))
+        values = self.values
+        if sys.byteorder == 'big':
+            values = array('d', values)
+            values.byteswap()
+        stream.write(memoryview(values))
+        stream.writelines(chain.from_iterable(
+            (pack('<I', len(data)), data)
+            for data in map(str.encode, self.keys)))
+
+
+def to_kv_columns(keys: Iterable[str],
+                  values: Iterable[Union[int, float]]) -> KVColumns:
+    """
+    Returns the `to_kv` pairs of parallel keys and values as columns.
+
+    Parameters:
+    keys (Iterable[str]): The strings to use as keys.
+    values (Iterable[Union[int, float]]): The numbers to square, in the
+    same order as `keys`.
+
+    Returns:
+    KVColumns: The keys and the squares of the values.
+
+    Example Usage:
+    --------------
+    >>> columns = to_kv_columns(["eggs", "school"], [3, 0.5])
+    >>> list(columns)
+    [('eggs', 9.0), ('school', 0.25)]
+    """
+    left, right = tee(values)
+    return KVColumns(list(keys), array('d', map(mul, left, right)))
@@ -4,9 +4,72 @@ Module for creating a multiplier function.
 
 This module provides a function to take a floating-point multiplier as input
 and return a new function that multiplies any given float by this multiplier.
+The returned object can also scale whole arrays in place, and composing two
+multipliers folds them into a single constant.
 """
 
-from typing import Callable
+from array import array
+from itertools import repeat
+from operator import mul
+from typing import Callable, Union
+
+
+class Multiplier:
+    """
+    A callable that multiplies its argument by a fixed constant.
+
+    Calling it on a number behaves like `lambda x: x * multiplier`. `apply`
+    scales every element of an array or writable memoryview in place with a
+    single C-level pass, and `a * b` (or `a(b)` when `b` is a Multiplier)
+    returns one Multiplier for the product of both constants instead of
+    nesting calls.
+    """
+
+    __slots__ = ('multiplier',)
+
+    def __init__(self, multiplier: float) -> None:
+        """
+        Parameters:
+        multiplier (float): The constant each value is multiplied by.
+        """
+        self.multiplier = multiplier
+
+    def __call__(self, x: Union[float, 'Multiplier']):
+        """
+        Returns `x * multiplier`, or the composed Multiplier when `x` is
+        itself a Multiplier.
+        """
+        if isinstance(x, Multiplier):
+            return Multiplier(x.multiplier * self.multiplier)
+        return x * self.multiplier
+
+    def __mul__(self, other: 'Multiplier') -> 'Multiplier':
+        """
+        Returns a Multiplier equivalent to applying `other` then `self`.
+        """
+        if not isinstance(other, Multiplier):
+            return NotImplemented
+        return Multiplier(other.multiplier * self.multiplier)
+
+    def apply(self, buffer: Union[array, memoryview]):
+        """
+        Multiplies every element of `buffer` by the constant, in place.
+
+        Parameters:
+        buffer (Union[array, memoryview]): An array or a writable,
+        one-dimensional memoryview. Integer buffers need an integer
+        multiplier.
+
+        Returns:
+        Union[array, memoryview]: The same `buffer`, for chaining.
+        """
+        view = memoryview(buffer)
+        view[:] = array(view.format,
+                        map(mul, view, repeat(self.multiplier)))
+        return buffer
+
+    def __repr__(self) -> str:
+        return "Multiplier({!r})".format(self.multiplier)
 
 
 def make_multiplier(multiplier: float) -> Callable[[float], float]:
@@ -33,5 +96,11 @@ def make_multiplier(multiplier: float) -> Callable[[float], float]:
     >>> multiply_by_neg3 = make_multiplier(-3.0)
     >>> multiply_by_neg3(4.0)
     -12.0
+
+    >>> make_multiplier(2.0).apply(array('d', [1.0, 2.5]))
+    array('d', [2.0, 5.0])
+
+    >>> make_multiplier(2.0) * make_multiplier(3.0)
+    Multiplier(6.0)
     """
-    return lambda x: x * multiplier
+    return Multiplier(multiplier)
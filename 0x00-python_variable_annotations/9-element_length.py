@@ -4,9 +4,15 @@ Module for annotating and processing sequences.
 
 This module provides a function that takes an iterable of sequences and returns
 a list of tuples. Each tuple contains a sequence from the input and its length.
+It also provides streaming and columnar variants for large inputs, and a
+function that measures the lines of a file or memory map without decoding
+them into strings.
 """
 
-from typing import Iterable, Sequence, List, Tuple
+from array import array
+from mmap import ACCESS_READ, mmap
+from typing import (BinaryIO, Iterable, Iterator, List, Sequence, Tuple,
+                    Union)
 
 
 def element_length(lst: Iterable[Sequence]) -> List[Tuple[Sequence, int]]:
@@ -36,3 +42,126 @@ def element_length(lst: Iterable[Sequence]) -> List[Tuple[Sequence, int]]:
     [("Israel", 5), ("Pascal", 6), ("Lawson", 6)]
     """
     return [(i, len(i)) for i in lst]
+
+
+def iter_element_length(
+    lst: Iterable[Sequence]
+) -> Iterator[Tuple[Sequence, int]]:
+    """
+    Yields the same `(sequence, length)` pairs as `element_length`, one at a
+    time, so each sequence can be released as soon as it is consumed.
+
+    Parameters:
+    lst (Iterable[Sequence]): An iterable containing sequences.
+
+    Returns:
+    Iterator[Tuple[Sequence, int]]: An iterator of `(sequence, length)`
+    pairs.
+
+    Example Usage:
+    --------------
+    >>> next(iter_element_length(["hello", "Lawson"]))
+    ('hello', 5)
+    """
+    if isinstance(lst, Sequence):
+        return zip(lst, map(len, lst))
+    return ((i, len(i)) for i in lst)
+
+
+def element_lengths(lst: Iterable[Sequence], typecode: str = 'q') -> array:
+    """
+    Returns only the lengths of the sequences, packed into an array.
+
+    Parameters:
+    lst (Iterable[Sequence]): An iterable containing sequences.
+    typecode (str, optional): The integer typecode of the result.
+    Defaults to 'q' (signed 64-bit).
+
+    Returns:
+    array: The length of each sequence, in input order.
+
+    Example Usage:
+    --------------
+    >>> element_lengths(["Israel", "Pascal", "Lawson"])
+    array('q', [6, 6, 6])
+    """
+    return array(typecode, map(len, lst))
+
+
+def element_length_columns(
+    lst: Iterable[Sequence], typecode: str = 'q'
+) -> Tuple[List[Sequence], array]:
+    """
+    Returns the sequences and their lengths as two parallel columns instead
+    of one tuple per item.
+
+    Parameters:
+    lst (Iterable[Sequence]): An iterable containing sequences.
+    typecode (str, optional): The integer typecode of the lengths column.
+    Defaults to 'q'.
+
+    Returns:
+    Tuple[List[Sequence], array]: The sequences and, at the same positions,
+    their lengths.
+
+    Example Usage:
+    --------------
+    >>> element_length_columns([[1, 2], [3, 4, 5], [6]])
+    ([[1, 2], [3, 4, 5], [6]], array('q', [2, 3, 1]))
+    """
+    items = list(lst)
+    return items, array(typecode, map(len, items))
+
+
+def line_lengths(source: Union[str, BinaryIO, bytes, mmap],
+                 keepends: bool = False, typecode: str = 'q') -> array:
+    """
+    Returns the length in bytes of every line of a file, memory map or bytes
+    object.
+
+    Buffers and memory maps are scanned for newlines in place, so no line is
+    copied out. A path is opened and memory-mapped; any other binary file
+    object is read line by line.
+
+    Parameters:
+    source (Union[str, BinaryIO, bytes, mmap]): A file path, a file opened
+    in binary mode, or a buffer such as `bytes` or an `mmap`.
+    keepends (bool, optional): Count the trailing newline as part of each
+    line. Defaults to False.
+    typecode (str, optional): The integer typecode of the result.
+    Defaults to 'q'.
+
+    Returns:
+    array: The byte length of each line, in file order.
+
+    Example Usage:
+    --------------
+    >>> line_lengths(b"hello\\nLawson\\n")
+    array('q', [5, 6])
+    """
+    if isinstance(source, str):
+        with open(source, 'rb') as stream:
+            try:
+                with mmap(stream.fileno(), 0, access=ACCESS_READ) as mapped:
+                    return line_lengths(mapped, keepends, typecode)
+            except ValueError:
+                # Empty files cannot be memory-mapped.
+                return array(typecode)
+    extra = 1 if keepends else 0
+    if not hasattr(source, 'find'):
+        if keepends:
+            return array(typecode, map(len, source))
+        return array(typecode, (len(line) - line.endswith(b'\n')
+                                for line in source))
+    lengths = array(typecode)
+    append = lengths.append
+    find = source.find
+    start, end = 0, len(source)
+    while start < end:
+        newline = find(b'\n', start)
+        if newline < 0:
+            append(end - start)
+            break
+        append(newline - start + extra)
+        start = newline + 1
+    return lengths
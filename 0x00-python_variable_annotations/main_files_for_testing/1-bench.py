@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+
+from io import StringIO
+from time import perf_counter
+
+concat = __import__('1-concat').concat
+Rope = __import__('1-concat').Rope
+
+# Repeated concat copies the whole result on every call, so it is only
+# timed up to this many appends.
+NAIVE_LIMIT = 10 ** 5
+piece = "0123456789"
+
+
+def with_str(n):
+    text = ""
+    for _ in range(n):
+        text = concat(text, piece)
+    return text
+
+
+def with_rope(n):
+    text = Rope()
+    for _ in range(n):
+        text = concat(text, piece)
+    return str(text)
+
+
+def with_rope_streamed(n):
+    text = Rope()
+    for _ in range(n):
+        text.append(piece)
+    return text.write_to(StringIO())
+
+
+for n in (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6):
+    print("{} appends".format(n))
+    for name, case in (("concat(str, str)", with_str),
+                       ("concat(Rope, str)", with_rope),
+                       ("Rope.append + write_to", with_rope_streamed)):
+        if case is with_str and n > NAIVE_LIMIT:
+            print("    {:<24} {:>10}".format(name, "skipped"))
+            continue
+        start = perf_counter()
+        case(n)
+        print("    {:<24} {:10.2f} ms".format(
+            name, (perf_counter() - start) * 1000))
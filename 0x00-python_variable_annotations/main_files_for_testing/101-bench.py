@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+
+from timeit import repeat
+
+module = __import__('101-safely_get_value')
+safely_get_value = module.safely_get_value
+safely_get_values = module.safely_get_values
+safely_get_paths = module.safely_get_paths
+compile_path = module.compile_path
+
+config = {"key{}".format(i): {"value": i} for i in range(5000)}
+keys = ["key{}".format(i) for i in range(0, 10000, 2)]
+dotted = ["{}.value".format(key) for key in keys]
+paths = [compile_path(path) for path in dotted]
+
+
+def one_key_at_a_time():
+    return [safely_get_value(config, key) for key in keys]
+
+
+def one_path_at_a_time():
+    values = []
+    for path in dotted:
+        value = config
+        for key in path.split("."):
+            value = safely_get_value(value, key)
+            if value is None:
+                break
+        values.append(value)
+    return values
+
+
+assert one_key_at_a_time() == safely_get_values(config, keys)
+assert one_path_at_a_time() == safely_get_paths(config, paths)
+
+cases = {
+    "safely_get_value per key": one_key_at_a_time,
+    "safely_get_values": lambda: safely_get_values(config, keys),
+    "safely_get_value per path": one_path_at_a_time,
+    "safely_get_paths": lambda: safely_get_paths(config, paths),
+}
+print("{} lookups, half of them missing".format(len(keys)))
+for name, case in cases.items():
+    best = min(repeat(case, number=100, repeat=5)) / 100
+    print("    {:<28} {:8.1f} us".format(name, best * 1e6))
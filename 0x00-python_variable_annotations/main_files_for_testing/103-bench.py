@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+
+from timeit import repeat
+
+typechecked = __import__('103-typechecked').typechecked
+
+add = __import__('0-add').add
+sum_list = __import__('5-sum_list').sum_list
+to_kv = __import__('7-to_kv').to_kv
+zoom_array = __import__('102-type_checking').zoom_array
+
+floats = [float(i) for i in range(1000)]
+cases = {
+    "add(1.5, 2.5)": (add, (1.5, 2.5)),
+    "sum_list(1000 floats)": (sum_list, (floats,)),
+    "to_kv('eggs', 3)": (to_kv, ("eggs", 3)),
+    "zoom_array((12, 72, 91), 3)": (zoom_array, ((12, 72, 91), 3)),
+}
+
+print("{:<30} {:>10} {:>10} {:>10}".format(
+    "call", "plain ns", "checked ns", "overhead"))
+for name, (func, args) in cases.items():
+    checked = typechecked(func)
+    plain_ns = min(repeat(lambda: func(*args), number=10000, repeat=5)) / 1e4
+    checked_ns = min(
+        repeat(lambda: checked(*args), number=10000, repeat=5)) / 1e4
+    print("{:<30} {:10.0f} {:10.0f} {:9.0f}%".format(
+        name, plain_ns * 1e9, checked_ns * 1e9,
+        (checked_ns / plain_ns - 1) * 100))
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+
+from array import array
+from random import uniform
+from timeit import repeat
+
+to_str = __import__('3-to_str').to_str
+write_floats = __import__('3-to_str').write_floats
+floor = __import__('2-floor').floor
+
+values = array('d', (uniform(-1e6, 1e6) for _ in range(10 ** 6)))
+
+
+def per_value_to_str():
+    out = bytearray()
+    out += "\n".join(map(to_str, values)).encode()
+    out += b"\n"
+    return out
+
+
+def per_value_floor():
+    out = bytearray()
+    out += "\n".join(str(floor(value)) for value in values).encode()
+    out += b"\n"
+    return out
+
+
+def bulk(**options):
+    out = bytearray()
+    write_floats(values, out, **options)
+    return out
+
+
+assert per_value_to_str() == bulk()
+assert per_value_floor() == bulk(floor=True)
+
+cases = {
+    "join(map(to_str))": per_value_to_str,
+    "write_floats": bulk,
+    "join(str(floor()))": per_value_floor,
+    "write_floats(floor=True)": lambda: bulk(floor=True),
+    "write_floats(precision=3)": lambda: bulk(precision=3),
+}
+print("{} floats".format(len(values)))
+for name, case in cases.items():
+    best = min(repeat(case, number=1, repeat=3))
+    print("    {:<28} {:8.1f} ms".format(name, best * 1000))
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+
+from array import array
+from random import random
+from timeit import repeat
+
+sum_list = __import__('5-sum_list').sum_list
+sum_buffer = __import__('5-sum_list').sum_buffer
+sum_chunks = __import__('5-sum_list').sum_chunks
+
+for size in (10 ** 4, 10 ** 5, 10 ** 6):
+    floats = [random() for _ in range(size)]
+    buf = array('d', floats)
+    chunks = [buf[i:i + 4096] for i in range(0, size, 4096)]
+    cases = {
+        "sum_list(list)": lambda: sum_list(floats),
+        "sum_list(array.tolist())": lambda: sum_list(buf.tolist()),
+        "sum_buffer(array)": lambda: sum_buffer(buf),
+        "sum_buffer(array, compensated)":
+            lambda: sum_buffer(buf, compensated=True),
+        "sum_chunks(arrays)": lambda: sum_chunks(chunks),
+    }
+    print("n = {}".format(size))
+    for name, case in cases.items():
+        best = min(repeat(case, number=10, repeat=5)) / 10
+        print("    {:<32} {:10.3f} ms".format(name, best * 1000))
@@ -8,28 +8,45 @@ delay and returns the actual delay.
 
 The function wait_random takes an integer argument `max_delay` with a default
 value of 10. It waits for a random amount of time between 0 and `max_delay`
-seconds and then returns the duration of the delay.
+seconds and then returns the duration of the delay. The sleep itself can be
+delegated to another timer backend, such as a TimingWheel, and the delay can
+be taken from a delay source, such as the UniformDelays of 9-delay_sources,
+instead of the global random number generator.
 
 Functions:
-    - wait_random(max_delay: int = 10) -> float: Waits for a random delay
+    - wait_random(max_delay: int = 10, sleep: Sleep = None,
+    delays: Iterator[float] = None) -> float: Waits for a random delay
     between 0 and max_delay seconds and returns the actual delay.
 """
 
 import asyncio
 import random
+from typing import Awaitable, Callable, Iterator, Optional
 
+Sleep = Callable[[float], Awaitable]
 
-async def wait_random(max_delay: int = 10) -> float:
+
+async def wait_random(max_delay: int = 10,
+                      sleep: Optional[Sleep] = None,
+                      delays: Optional[Iterator[float]] = None) -> float:
     """
     Wait for a random delay between 0 and max_delay seconds and return the
     actual delay.
 
     Parameters:
     max_delay (int): The maximum number of seconds to wait. Default is 10.
+    sleep (Optional[Sleep]): The function used to sleep, with the signature
+    of asyncio.sleep. Default is None, which uses asyncio.sleep.
+    delays (Optional[Iterator[float]]): The source of the delay, which is
+    used instead of max_delay. Default is None, which draws the delay from
+    the random module.
 
     Returns:
     float: The actual number of seconds waited.
     """
-    delay = max_delay * random.random()
-    await asyncio.sleep(delay)
+    if delays is None:
+        delay = max_delay * random.random()
+    else:
+        delay = next(delays)
+    await (sleep or asyncio.sleep)(delay)
     return delay
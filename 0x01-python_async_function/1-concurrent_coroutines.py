@@ -12,18 +12,109 @@ defines an async routine wait_n that takes two integer arguments, `n` and
 `max_delay`. The wait_n function returns a list of all the delays
 (float values) in ascending order without using the sort() method.
 
+Passing `max_in_flight` bounds how many coroutines run at once: a fixed
+window of workers starts a new coroutine each time one finishes, so the
+number of live tasks, and the memory they hold, no longer grows with `n`.
+Passing a TokenBucket as `limiter` paces the spawns instead of starting
+them in one burst.
+
 Functions:
-    - wait_n(n: int, max_delay: int = 10) -> List[float]: Spawns wait_random
-      n times with the specified max_delay and returns the list of delays in
+    - wait_n(n: int, max_delay: int = 10, *, max_in_flight: int = None,
+      sleep: Sleep = None, delays: Iterator[float] = None,
+      limiter: TokenBucket = None) -> List[float]: Spawns wait_random n
+      times with the specified max_delay and returns the list of delays in
       ascending order.
+    - run_indexed(factory: Callable[[int], Awaitable], n: int,
+      max_in_flight: int) -> List: Awaits factory(0) to factory(n - 1) with
+      at most max_in_flight of them pending, in index order.
+    - run_bounded(factory: Callable[[], Awaitable[float]], n: int,
+      max_in_flight: int) -> List[float]: Awaits n results of factory with
+      at most max_in_flight of them pending, in ascending order.
+    - wait_n_as_completed(n: int, max_delay: int = 10)
+      -> AsyncIterator[float]: Spawns wait_random n times and yields each
+      delay as soon as its task completes.
 """
 
 import asyncio
-from typing import List
+from functools import partial
+from typing import (TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable,
+                    Iterator, List, Optional)
 wait_random = __import__('0-basic_async_syntax').wait_random
+Sleep = __import__('0-basic_async_syntax').Sleep
+if TYPE_CHECKING:
+    TokenBucket = __import__('11-rate_limit').TokenBucket
+
+
+async def run_indexed(factory: Callable[[int], Awaitable], n: int,
+                      max_in_flight: int) -> List[Any]:
+    """
+    Await factory(i) for every index i below n while keeping at most
+    max_in_flight of them pending, and return the results in index order.
+
+    Each of the max_in_flight workers takes the next index as soon as its
+    previous awaitable finishes and stores the result at that index, so
+    the results need not be comparable.
+
+    Parameters:
+    factory (Callable[[int], Awaitable]): Returns a new awaitable for an
+    index, such as a coroutine or a task.
+    n (int): The total number of awaitables to run.
+    max_in_flight (int): The maximum number of awaitables pending at once.
+
+    Returns:
+    List[Any]: The n results, the result of factory(i) at index i.
+    """
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be at least 1")
+    result_ls: List[Any] = [None] * n
+    next_index = 0
+
+    async def worker() -> None:
+        nonlocal next_index
+        while next_index < n:
+            index = next_index
+            next_index += 1
+            result_ls[index] = await factory(index)
+
+    workers = [asyncio.create_task(worker())
+               for _ in range(min(max_in_flight, n))]
+    try:
+        for worker_task in workers:
+            await worker_task
+    finally:
+        for worker_task in workers:
+            worker_task.cancel()
+    return result_ls
+
+
+async def run_bounded(factory: Callable[[], Awaitable[float]], n: int,
+                      max_in_flight: int) -> List[float]:
+    """
+    Await n results of factory while keeping at most max_in_flight of them
+    pending, and return them in ascending order.
+
+    This is run_indexed for awaitables that do not depend on their index.
+    With a window, results no longer finish in ascending order, so they are
+    sorted before being returned.
+
+    Parameters:
+    factory (Callable[[], Awaitable[float]]): Returns a new awaitable each
+    time it is called, such as a coroutine or a task.
+    n (int): The total number of awaitables to run.
+    max_in_flight (int): The maximum number of awaitables pending at once.
+
+    Returns:
+    List[float]: The n results in ascending order.
+    """
+    return sorted(await run_indexed(lambda index: factory(), n,
+                                    max_in_flight))
 
 
-async def wait_n(n: int, max_delay: int = 10) -> List[float]:
+async def wait_n(n: int, max_delay: int = 10, *,
+                 max_in_flight: Optional[int] = None,
+                 sleep: Optional[Sleep] = None,
+                 delays: Optional[Iterator[float]] = None,
+                 limiter: Optional['TokenBucket'] = None) -> List[float]:
     """
     Spawn wait_random n times with the specified max_delay and return the list
     of delays in ascending order.
@@ -32,18 +123,83 @@ async def wait_n(n: int, max_delay: int = 10) -> List[float]:
     n (int): The number of times to spawn wait_random.
     max_delay (int): The maximum number of seconds to wait for each call to
     wait_random. Default is 10.
+    max_in_flight (Optional[int]): The maximum number of wait_random
+    coroutines running at once. Default is None, which runs all n at once.
+    sleep (Optional[Sleep]): The function wait_random sleeps with, such as
+    TimingWheel().sleep. Default is None, which uses asyncio.sleep.
+    delays (Optional[Iterator[float]]): The source every wait_random takes
+    its delay from, such as UniformDelays(max_delay, seed=0) for a
+    reproducible run. Default is None, which uses the random module.
+    limiter (Optional[TokenBucket]): The rate limiter each spawn acquires a
+    token from, and reports its latency to. Default is None, which spawns
+    without limit.
 
     Returns:
     List[float]: A list of delays in ascending order.
     """
+    factory = partial(wait_random, max_delay, sleep, delays)
+    if max_in_flight is not None:
+        if limiter is not None:
+            factory = limiter.limit(factory)
+        return await run_bounded(factory, n, max_in_flight)
     spawn_ls = []
     delay_ls = []
     for i in range(n):
-        delayed_task = asyncio.create_task(wait_random(max_delay))
+        if limiter is None:
+            delayed_task = asyncio.create_task(factory())
+        else:
+            await limiter.acquire()
+            delayed_task = limiter.track(factory())
         delayed_task.add_done_callback(lambda x: delay_ls.append(x.result()))
         spawn_ls.append(delayed_task)
 
     for spawn in spawn_ls:
         await spawn
 
+    # Tasks that finish in the same loop iteration as the last awaited one
+    # have their done callbacks queued behind this coroutine's wakeup; one
+    # more iteration lets them append their delays.
+    await asyncio.sleep(0)
     return delay_ls
+
+
+async def wait_n_as_completed(n: int,
+                              max_delay: int = 10) -> AsyncIterator[float]:
+    """
+    Spawn wait_random n times with the specified max_delay and yield each
+    delay as soon as its task completes, so in ascending order.
+
+    Leaving the loop early cancels the tasks that are still running and
+    waits for them to finish cancelling. Async generators are only closed
+    when they are garbage collected, so wrap the generator in
+    contextlib.aclosing to cancel them right away:
+
+        async with aclosing(wait_n_as_completed(100)) as delays:
+            async for delay in delays:
+                if delay > 1:
+                    break
+
+    Parameters:
+    n (int): The number of times to spawn wait_random.
+    max_delay (int): The maximum number of seconds to wait for each call to
+    wait_random. Default is 10.
+
+    Yields:
+    float: The delay of each task, in completion order.
+    """
+    done: asyncio.Queue = asyncio.Queue()
+    spawn_ls = []
+    for i in range(n):
+        delayed_task = asyncio.create_task(wait_random(max_delay))
+        delayed_task.add_done_callback(done.put_nowait)
+        spawn_ls.append(delayed_task)
+    try:
+        for i in range(n):
+            finished = await done.get()
+            yield finished.result()
+    finally:
+        pending = [spawn for spawn in spawn_ls if not spawn.done()]
+        for spawn in pending:
+            spawn.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
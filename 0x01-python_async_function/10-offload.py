@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+
+"""
+Module: offload
+
+This module contains a fan-out like wait_n for blocking work: plain
+callables, such as a file read, a JSON decode or a hash, that would stall
+the event loop if they were called from a coroutine.
+
+Each job runs through loop.run_in_executor on one of two bounded pools held
+by an Offload: a thread pool for I/O-bound jobs, which release the GIL while
+they wait, and a process pool for CPU-bound jobs, which need a core of their
+own. Jobs are I/O-bound unless they are wrapped with cpu_bound, so a single
+call can mix both kinds, each limited by its own pool size.
+
+Classes:
+    - CpuBound(func, *args): A job that runs in the process pool.
+    - Offload(io_workers: int = None, cpu_workers: int = None): The pair of
+      executors jobs run on.
+
+Functions:
+    - cpu_bound(func: Callable, *args) -> CpuBound: Marks a job as
+      CPU-bound.
+    - blocking_wait_random(max_delay: int = 10) -> float: The blocking
+      counterpart of wait_random.
+    - offload_n(jobs: Iterable[Callable[[], Any]], *, offload: Offload = None,
+      max_in_flight: int = None) -> List: Runs the jobs on the executors
+      and returns their results in job order.
+"""
+
+import asyncio
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Iterable, List, Optional
+
+run_indexed = __import__('1-concurrent_coroutines').run_indexed
+
+
+class CpuBound:
+    """
+    A job that Offload runs in its process pool, as func(*args).
+
+    func, args and the result are sent between processes, so they must be
+    picklable; in particular func must be defined at the top level of a
+    module.
+    """
+
+    __slots__ = ('func', 'args')
+
+    def __init__(self, func: Callable, *args: Any) -> None:
+        self.func = func
+        self.args = args
+
+    def __call__(self) -> Any:
+        return self.func(*self.args)
+
+    def __repr__(self) -> str:
+        return "cpu_bound({!r}, *{!r})".format(self.func, self.args)
+
+
+def cpu_bound(func: Callable, *args: Any) -> CpuBound:
+    """
+    Mark func(*args) as a CPU-bound job.
+
+    Parameters:
+    func (Callable): A picklable function.
+    args: The picklable arguments func is called with.
+
+    Returns:
+    CpuBound: The job.
+    """
+    return CpuBound(func, *args)
+
+
+def blocking_wait_random(max_delay: int = 10) -> float:
+    """
+    Block for a random delay between 0 and max_delay seconds and return the
+    actual delay, like wait_random but with time.sleep.
+
+    Parameters:
+    max_delay (int): The maximum number of seconds to block. Default is 10.
+
+    Returns:
+    float: The actual number of seconds blocked.
+    """
+    delay = max_delay * random.random()
+    time.sleep(delay)
+    return delay
+
+
+class Offload:
+    """
+    A thread pool for I/O-bound jobs and a process pool for CPU-bound jobs.
+
+    The pools are created the first time a job needs them and shut down by
+    shutdown or on leaving a with block, or, from a coroutine, by aclose or
+    on leaving an async with block, which wait for the running jobs in a
+    thread so the event loop keeps running.
+
+    Attributes:
+    io_workers (Optional[int]): The size of the thread pool.
+    cpu_workers (Optional[int]): The size of the process pool.
+    """
+
+    def __init__(self, io_workers: Optional[int] = None,
+                 cpu_workers: Optional[int] = None) -> None:
+        """
+        Parameters:
+        io_workers (Optional[int]): The number of threads. Default is None,
+        which uses the ThreadPoolExecutor default.
+        cpu_workers (Optional[int]): The number of processes. Default is
+        None, which uses one per CPU.
+        """
+        self.io_workers = io_workers
+        self.cpu_workers = cpu_workers
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+        self._cpu_pool: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def io_pool(self) -> ThreadPoolExecutor:
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(
+                self.io_workers, thread_name_prefix='offload-io')
+        return self._io_pool
+
+    @property
+    def cpu_pool(self) -> ProcessPoolExecutor:
+        if self._cpu_pool is None:
+            self._cpu_pool = ProcessPoolExecutor(self.cpu_workers)
+        return self._cpu_pool
+
+    def run(self, job: Callable[[], Any]) -> asyncio.Future:
+        """
+        Start job on the pool for its kind, from a running event loop.
+
+        Parameters:
+        job (Callable[[], Any]): A CpuBound job, or any other callable taking
+        no arguments, which runs as an I/O-bound job.
+
+        Returns:
+        asyncio.Future: A future for the result of the job.
+        """
+        loop = asyncio.get_running_loop()
+        if isinstance(job, CpuBound):
+            return loop.run_in_executor(self.cpu_pool, job.func, *job.args)
+        return loop.run_in_executor(self.io_pool, job)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Shut down the pools that were created. Jobs that have not started
+        are cancelled.
+
+        Parameters:
+        wait (bool): Whether to block until the running jobs finish.
+        Default is True.
+        """
+        for pool in (self._io_pool, self._cpu_pool):
+            if pool is not None:
+                pool.shutdown(wait, cancel_futures=True)
+        self._io_pool = self._cpu_pool = None
+
+    async def aclose(self, wait: bool = True) -> None:
+        """
+        Shut down the pools like shutdown, but wait for the running jobs in
+        a thread instead of blocking the event loop.
+
+        Parameters:
+        wait (bool): Whether to wait until the running jobs finish.
+        Default is True.
+        """
+        await asyncio.to_thread(self.shutdown, wait)
+
+    def __enter__(self) -> 'Offload':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.shutdown()
+
+    async def __aenter__(self) -> 'Offload':
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+
+async def offload_n(jobs: Iterable[Callable[[], Any]], *,
+                    offload: Optional[Offload] = None,
+                    max_in_flight: Optional[int] = None) -> List:
+    """
+    Run every job on the executors of offload and return the results in
+    the order of the jobs, like asyncio.gather, whatever order they
+    finish in.
+
+    Parameters:
+    jobs (Iterable[Callable[[], Any]]): The jobs; wrap CPU-bound ones with
+    cpu_bound and the arguments of the others with functools.partial.
+    offload (Optional[Offload]): The executors to run on. Default is None,
+    which creates an Offload for this call and shuts it down afterwards
+    without waiting, so a failing or cancelled call returns at once while
+    the jobs already running finish in the background.
+    max_in_flight (Optional[int]): The maximum number of jobs submitted at
+    once; each of max_in_flight workers submits the next job as soon as its
+    previous one finishes. Default is None, which submits every job at once
+    and leaves the pools to queue them.
+
+    Returns:
+    List: The results of the jobs, in job order.
+    """
+    owned = offload is None
+    runner = Offload() if offload is None else offload
+    try:
+        if max_in_flight is None:
+            return list(await asyncio.gather(*map(runner.run, jobs)))
+        job_ls = list(jobs)
+        return await run_indexed(lambda index: runner.run(job_ls[index]),
+                                 len(job_ls), max_in_flight)
+    finally:
+        if owned:
+            runner.shutdown(wait=False)
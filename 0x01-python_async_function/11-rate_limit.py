@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+
+"""
+Module: rate_limit
+
+This module contains a token bucket that paces how fast wait_n and
+task_wait_n spawn their tasks, so a large n reaches a downstream service as
+a steady stream instead of a single burst.
+
+The bucket holds up to burst tokens and gains rate tokens per second. Every
+spawn takes a token; when none is left, the spawn reserves the next one and
+sleeps until it is due. Reservations are kept as a negative token count, so
+waiters need no queue and are released in the order they arrived.
+
+With target_latency set, the bucket also adapts its rate to the latency of
+the tasks it spawns: additive increase while tasks finish within the target
+and multiplicative decrease when one does not, never going above the rate
+it was created with. The rate is decreased at most once per window of
+completions: right after a decrease, the tasks spawned at the old rate are
+still finishing, and letting each of them cut the rate again would drive
+it down to min_rate within a single burst of slow tasks.
+
+Classes:
+    - TokenBucket(rate: float, burst: int = 1, *, target_latency: float =
+      None, min_rate: float = None, increase: float = None,
+      decrease: float = 0.5, window: int = None): A rate limiter with
+      optional adaptive backoff.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Optional
+
+
+class TokenBucket:
+    """
+    A token bucket rate limiter for use inside a running event loop.
+
+    Attributes:
+    rate (float): The current number of tokens added per second.
+    max_rate (float): The rate the bucket was created with, which adaptive
+    increases do not go above.
+    burst (int): The maximum number of tokens held.
+    tokens (float): The tokens currently held; negative while spawns are
+    waiting for reserved tokens.
+    acquired (int): The number of tokens handed out.
+    throttled (int): The number of acquires that had to wait.
+    waited (float): The total number of seconds acquires waited.
+    backoffs (int): The number of times the rate was decreased.
+    """
+
+    def __init__(self, rate: float, burst: int = 1, *,
+                 target_latency: Optional[float] = None,
+                 min_rate: Optional[float] = None,
+                 increase: Optional[float] = None,
+                 decrease: float = 0.5,
+                 window: Optional[int] = None) -> None:
+        """
+        Parameters:
+        rate (float): The number of tokens added per second.
+        burst (int): The maximum number of tokens held, and so the largest
+        number of spawns let through at once. Default is 1.
+        target_latency (Optional[float]): The task latency, in seconds,
+        above which the rate is decreased. Default is None, which keeps the
+        rate fixed.
+        min_rate (Optional[float]): The lowest rate backoff goes down to.
+        Default is None, which is rate / 100.
+        increase (Optional[float]): The tokens per second added to the rate
+        for each task within target_latency. Default is None, which is
+        rate / 100.
+        decrease (float): The factor the rate is multiplied by when a task
+        is over target_latency. Default is 0.5.
+        window (Optional[int]): The number of tasks that must finish after
+        a decrease before a slow task can decrease the rate again. Default
+        is None, which is burst.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        if not 0 < decrease < 1:
+            raise ValueError("decrease must be between 0 and 1")
+        self.rate = self.max_rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.target_latency = target_latency
+        self.min_rate = rate / 100 if min_rate is None else min_rate
+        self.increase = rate / 100 if increase is None else increase
+        self.decrease = decrease
+        self.window = burst if window is None else window
+        self.acquired = 0
+        self.throttled = 0
+        self.waited = 0.0
+        self.backoffs = 0
+        self._last: Optional[float] = None
+        self._since_backoff = self.window
+
+    def _refill(self, now: float) -> None:
+        """
+        Add the tokens earned since the last refill, up to burst.
+        """
+        if self._last is not None:
+            self.tokens = min(self.burst,
+                              self.tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    async def acquire(self) -> None:
+        """
+        Take a token, sleeping until one is due if the bucket is empty.
+        A cancelled acquire gives its reserved token back.
+        """
+        self._refill(asyncio.get_running_loop().time())
+        self.tokens -= 1
+        self.acquired += 1
+        if self.tokens >= 0:
+            return
+        wait = -self.tokens / self.rate
+        self.throttled += 1
+        self.waited += wait
+        try:
+            await asyncio.sleep(wait)
+        except asyncio.CancelledError:
+            self.tokens += 1
+            self.acquired -= 1
+            raise
+
+    def observe(self, latency: float) -> None:
+        """
+        Adapt the rate to the latency of a finished task. Does nothing when
+        target_latency is None. The rate is decreased at most once per
+        window of finished tasks.
+
+        Parameters:
+        latency (float): The seconds from spawning the task to its end.
+        """
+        if self.target_latency is None:
+            return
+        self._since_backoff += 1
+        if latency > self.target_latency:
+            if self._since_backoff < self.window:
+                return
+            self._since_backoff = 0
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            self.backoffs += 1
+        else:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def track(self, awaitable: Awaitable) -> asyncio.Future:
+        """
+        Wrap awaitable in a task, or keep it if it is already a future, and
+        observe its latency when it finishes.
+
+        Parameters:
+        awaitable (Awaitable): A coroutine, task or future.
+
+        Returns:
+        asyncio.Future: The future for awaitable.
+        """
+        future = asyncio.ensure_future(awaitable)
+        if self.target_latency is not None:
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            future.add_done_callback(
+                lambda x: self.observe(loop.time() - start))
+        return future
+
+    def limit(self, factory: Callable[[], Awaitable]
+              ) -> Callable[[], Awaitable]:
+        """
+        Return a factory for run_bounded that acquires a token before each
+        call of factory and tracks the awaitable it returns.
+
+        Parameters:
+        factory (Callable[[], Awaitable]): Returns a new awaitable each time
+        it is called.
+
+        Returns:
+        Callable[[], Awaitable]: The rate-limited factory.
+        """
+        async def limited() -> Any:
+            await self.acquire()
+            return await self.track(factory())
+        return limited
+
+    def __repr__(self) -> str:
+        return ("TokenBucket(rate={:.6g}, burst={}, acquired={}, "
+                "throttled={}, waited={:.6g}, backoffs={})").format(
+                    self.rate, self.burst, self.acquired, self.throttled,
+                    self.waited, self.backoffs)
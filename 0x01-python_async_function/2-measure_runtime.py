@@ -8,7 +8,9 @@ asynchronous routine.
 
 The function measure_time takes two integer arguments, `n` and `max_delay`, and
 measures the total execution time for wait_n(n, max_delay). It returns the
-average time per task by dividing the total execution time by `n`.
+average time per task by dividing the total execution time by `n`. The time
+is read from the event loop's clock, so runs on a VirtualTimeLoop report
+virtual time.
 
 Functions:
     - measure_time(n: int, max_delay: int) -> float: Measures the total
@@ -17,13 +19,22 @@ Functions:
 """
 
 
-from time import time
-from asyncio import run
+from asyncio import get_running_loop, run
 
 
 wait_n = __import__('1-concurrent_coroutines').wait_n
 
 
+async def _timed_wait_n(n: int, max_delay: int) -> float:
+    """
+    Run wait_n(n, max_delay) and return how long it took by the loop clock.
+    """
+    loop = get_running_loop()
+    start_time = loop.time()
+    await wait_n(n, max_delay)
+    return loop.time() - start_time
+
+
 def measure_time(n: int, max_delay: int) -> float:
     """
     Measure the total execution time for wait_n(n, max_delay) and return the
@@ -37,8 +48,5 @@ def measure_time(n: int, max_delay: int) -> float:
     Returns:
     float: The average execution time per task.
     """
-    start_time = time()
-    run(wait_n(n, max_delay))
-    end_time = time()
-    total_time = end_time - start_time
+    total_time = run(_timed_wait_n(n, max_delay))
     return total_time / n
@@ -11,26 +11,36 @@ returns an asyncio.Task that runs the wait_random coroutine with the
 specified `max_delay`.
 
 Functions:
-    - task_wait_random(max_delay: int = 10) -> asyncio.Task: Creates and
-    returns an asyncio.Task for the wait_random coroutine.
+    - task_wait_random(max_delay: int = 10, sleep: Sleep = None,
+    delays: Iterator[float] = None) -> asyncio.Task: Creates and returns an
+    asyncio.Task for the wait_random coroutine.
 """
 
 
 import asyncio
+from typing import Iterator, Optional
 
 
 wait_random = __import__('0-basic_async_syntax').wait_random
+Sleep = __import__('0-basic_async_syntax').Sleep
 
 
-def task_wait_random(max_delay: int = 10) -> asyncio.Task:
+def task_wait_random(max_delay: int = 10,
+                     sleep: Optional[Sleep] = None,
+                     delays: Optional[Iterator[float]] = None
+                     ) -> asyncio.Task:
     """
     Create and return an asyncio.Task for the wait_random coroutine with the
     specified max_delay./
 
     Parameters:
     max_delay (int): The maximum number of seconds to wait. Default is 10.
+    sleep (Optional[Sleep]): The function wait_random sleeps with. Default
+    is None, which uses asyncio.sleep.
+    delays (Optional[Iterator[float]]): The source wait_random takes its
+    delay from. Default is None, which uses the random module.
 
     Returns:
     asyncio.Task: An asyncio.Task object running the wait_random coroutine.
     """
-    return asyncio.create_task(wait_random(max_delay))
+    return asyncio.create_task(wait_random(max_delay, sleep, delays))
@@ -9,21 +9,40 @@ a list of delays.
 The function task_wait_n is similar to wait_n but uses task_wait_random to
 create the asyncio.Tasks. It takes two integer arguments, `n` and `max_delay`,
 and returns a list of all the delays (float values) in ascending order.
+Like wait_n, it accepts `max_in_flight` to bound how many tasks exist at once,
+and `limiter` to pace their creation with a TokenBucket.
 
 Functions:
-    - task_wait_n(n: int, max_delay: int = 10) -> List[float]: Spawns
-      task_wait_random n times with the specified max_delay and returns the
-      list of delays in ascending order.
+    - task_wait_n(n: int, max_delay: int = 10, *, max_in_flight: int = None,
+      sleep: Sleep = None, delays: Iterator[float] = None,
+      limiter: TokenBucket = None) -> List[float]: Spawns task_wait_random
+      n times with the specified max_delay and returns the list of delays
+      in ascending order.
+    - task_wait_n_partial(n: int, max_delay: int = 10, *, quorum: int = None,
+      timeout: float = None, sleep: Sleep = None) -> PartialDelays: Returns
+      as soon as quorum tasks have finished or timeout seconds have passed,
+      cancelling the rest.
 """
 
 
-from typing import List
+import asyncio
+from functools import partial
+from typing import TYPE_CHECKING, Iterator, List, NamedTuple, Optional
 
 
 task_wait_random = __import__('3-tasks').task_wait_random
+run_bounded = __import__('1-concurrent_coroutines').run_bounded
+Sleep = __import__('0-basic_async_syntax').Sleep
+if TYPE_CHECKING:
+    TokenBucket = __import__('11-rate_limit').TokenBucket
 
 
-async def task_wait_n(n: int, max_delay: int = 10) -> List[float]:
+async def task_wait_n(n: int, max_delay: int = 10, *,
+                      max_in_flight: Optional[int] = None,
+                      sleep: Optional[Sleep] = None,
+                      delays: Optional[Iterator[float]] = None,
+                      limiter: Optional['TokenBucket'] = None
+                      ) -> List[float]:
     """
     Spawn task_wait_random n times with the specified max_delay and return the
     list of delays in ascending order.
@@ -32,18 +51,125 @@ async def task_wait_n(n: int, max_delay: int = 10) -> List[float]:
     n (int): The number of times to spawn task_wait_random.
     max_delay (int): The maximum number of seconds to wait for each call to
     task_wait_random. Default is 10.
+    max_in_flight (Optional[int]): The maximum number of tasks alive at
+    once. Default is None, which creates all n tasks at once.
+    sleep (Optional[Sleep]): The function wait_random sleeps with, such as
+    TimingWheel().sleep. Default is None, which uses asyncio.sleep.
+    delays (Optional[Iterator[float]]): The source every task takes
+    its delay from, such as UniformDelays(max_delay, seed=0) for a
+    reproducible run. Default is None, which uses the random module.
+    limiter (Optional[TokenBucket]): The rate limiter each task creation
+    acquires a token from, and reports its latency to. Default is None,
+    which creates the tasks without limit.
 
     Returns:
     List[float]: A list of delays in ascending order.
     """
+    factory = partial(task_wait_random, max_delay, sleep, delays)
+    if max_in_flight is not None:
+        if limiter is not None:
+            factory = limiter.limit(factory)
+        return await run_bounded(factory, n, max_in_flight)
     spawn_ls = []
     delay_ls = []
     for i in range(n):
-        delayed_task = task_wait_random(max_delay)
+        if limiter is None:
+            delayed_task = factory()
+        else:
+            await limiter.acquire()
+            delayed_task = limiter.track(factory())
         delayed_task.add_done_callback(lambda x: delay_ls.append(x.result()))
         spawn_ls.append(delayed_task)
 
     for spawn in spawn_ls:
         await spawn
 
+    # Tasks that finish in the same loop iteration as the last awaited one
+    # have their done callbacks queued behind this coroutine's wakeup; one
+    # more iteration lets them append their delays.
+    await asyncio.sleep(0)
     return delay_ls
+
+
+class PartialDelays(NamedTuple):
+    """
+    The result of task_wait_n_partial.
+
+    Attributes:
+    delays (List[float]): The delays of the tasks that finished, in
+    ascending order.
+    missing (List[int]): The positions, in spawn order, of the tasks that
+    were cancelled or failed and so have no delay.
+    complete (bool): True if every task finished.
+    """
+    delays: List[float]
+    missing: List[int]
+    complete: bool
+
+
+async def task_wait_n_partial(n: int, max_delay: int = 10, *,
+                              quorum: Optional[int] = None,
+                              timeout: Optional[float] = None,
+                              sleep: Optional[Sleep] = None) -> PartialDelays:
+    """
+    Spawn task_wait_random n times and return once quorum of the tasks have
+    finished or timeout seconds have passed, whichever comes first.
+
+    The tasks still running at that point are cancelled, and awaited so
+    they are fully cancelled before the function returns. A task that
+    raises counts as finished for the deadline but has no delay; its
+    position is reported in missing like a cancelled task.
+
+    Parameters:
+    n (int): The number of times to spawn task_wait_random.
+    max_delay (int): The maximum number of seconds to wait for each call to
+    task_wait_random. Default is 10.
+    quorum (Optional[int]): The number of delays to wait for. Default is
+    None, which waits for all n.
+    timeout (Optional[float]): The maximum number of seconds to wait.
+    Default is None, which waits without a time limit.
+    sleep (Optional[Sleep]): The function wait_random sleeps with. Default
+    is None, which uses asyncio.sleep.
+
+    Returns:
+    PartialDelays: The delays collected, the positions of the tasks with no
+    delay, and whether every task finished.
+    """
+    target = n if quorum is None else min(quorum, n)
+    spawn_ls = []
+    delay_ls = []
+    finished = 0
+    enough = asyncio.Event()
+
+    def collect(task: asyncio.Task) -> None:
+        nonlocal finished
+        if task.cancelled():
+            return
+        finished += 1
+        if task.exception() is None:
+            delay_ls.append(task.result())
+        if len(delay_ls) >= target or finished == n:
+            enough.set()
+
+    for i in range(n):
+        delayed_task = task_wait_random(max_delay, sleep)
+        delayed_task.add_done_callback(collect)
+        spawn_ls.append(delayed_task)
+    if target <= 0:
+        enough.set()
+
+    try:
+        await asyncio.wait_for(enough.wait(), timeout)
+    except asyncio.TimeoutError:
+        pass
+    finally:
+        pending = [spawn for spawn in spawn_ls if not spawn.done()]
+        for spawn in pending:
+            spawn.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        # As in task_wait_n, let queued done callbacks run.
+        await asyncio.sleep(0)
+
+    missing = [i for i, spawn in enumerate(spawn_ls)
+               if spawn.cancelled() or spawn.exception() is not None]
+    return PartialDelays(delay_ls, missing, not missing)
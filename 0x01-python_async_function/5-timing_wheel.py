@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+
+"""
+Module: timing_wheel
+
+This module contains a hashed timing wheel that can replace asyncio.sleep
+when a very large number of coroutines sleep at the same time.
+
+Each asyncio.sleep call adds its own timer to the event loop's heap, so n
+sleeping coroutines make every timer insertion and expiry cost O(log n).
+The wheel keeps a single loop timer instead. Time is divided into ticks of a
+fixed length, and each sleep is hashed by the tick it ends in into one of a
+fixed number of slots. Every tick the wheel wakes once and completes all the
+sleeps of that tick together, in the order of their exact deadlines. A sleep
+therefore lasts at least its delay and at most one tick longer.
+
+The sleep method has the same signature as asyncio.sleep, so it can be
+passed wherever the project accepts a `sleep` argument, for example
+`wait_n(n, max_delay, sleep=TimingWheel().sleep)`.
+
+Classes:
+    - TimingWheel(tick: float = 0.01, slots: int = 512): A timer backend
+      whose sleep method coalesces all sleeps ending in the same tick.
+"""
+
+import asyncio
+from math import ceil
+from typing import Any, List, Optional, Tuple
+
+
+def _exact_deadline(entry: Tuple[int, float, asyncio.Future, Any]) -> float:
+    """
+    Return the time at which the sleep of a wheel entry ends.
+    """
+    return entry[1]
+
+
+class TimingWheel:
+    """
+    A hashed timing wheel bound to the event loop it is first used in.
+    Once that loop is closed, the wheel drops the sleeps still pending on
+    it and binds to the next loop it is used in.
+
+    Attributes:
+    tick (float): The length of a tick, in seconds.
+    wakeups (int): The number of times the wheel has woken up.
+    scheduled (int): The number of sleeps started on the wheel.
+    """
+
+    def __init__(self, tick: float = 0.01, slots: int = 512) -> None:
+        """
+        Parameters:
+        tick (float): The length of a tick, in seconds. Default is 0.01.
+        slots (int): The number of slots of the wheel. Sleeps longer than
+        slots * tick stay in their slot for more than one turn of the wheel.
+        Default is 512.
+        """
+        if tick <= 0 or slots < 1:
+            raise ValueError("tick and slots must be positive")
+        self.tick = tick
+        self.wakeups = 0
+        self.scheduled = 0
+        self._slots: List[List[Tuple[int, float, asyncio.Future, Any]]] = [
+            [] for _ in range(slots)]
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._origin = 0.0
+        self._current = 0
+        self._pending = 0
+        self._handle: Optional[asyncio.TimerHandle] = None
+
+    def sleep(self, delay: float, result: Any = None) -> asyncio.Future:
+        """
+        Return a future that completes with result once delay seconds have
+        passed, rounded up to the next tick.
+
+        Parameters:
+        delay (float): The number of seconds to sleep.
+        result (Any): The value the future completes with. Default is None.
+
+        Returns:
+        asyncio.Future: A future to await.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is None or self._loop.is_closed():
+            self._rebind(loop)
+        elif self._loop is not loop:
+            raise RuntimeError("TimingWheel is bound to a different loop")
+        future = loop.create_future()
+        now = loop.time()
+        if self._handle is None:
+            self._origin = now
+            self._current = 0
+        deadline = max(ceil((now + delay - self._origin) / self.tick),
+                       self._current + 1)
+        self._slots[deadline % len(self._slots)].append(
+            (deadline, now + delay, future, result))
+        self._pending += 1
+        self.scheduled += 1
+        if self._handle is None:
+            self._schedule()
+        return future
+
+    def _rebind(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Bind the wheel to loop, discarding the sleeps and the timer left
+        over from a closed loop, which can never run again.
+        """
+        self._loop = loop
+        for slot in self._slots:
+            slot.clear()
+        self._pending = 0
+        self._current = 0
+        self._handle = None
+
+    def _schedule(self) -> None:
+        """
+        Arm the loop timer for the end of the next tick.
+        """
+        self._handle = self._loop.call_at(
+            self._origin + (self._current + 1) * self.tick, self._advance)
+
+    def _advance(self) -> None:
+        """
+        Complete the sleeps of every tick that has ended since the last
+        wakeup, then arm the timer again if sleeps are still pending.
+        """
+        self.wakeups += 1
+        # The timer was armed for the next tick, which therefore has ended
+        # even if the clock reads a hair earlier.
+        last = max(int((self._loop.time() - self._origin) / self.tick),
+                   self._current + 1)
+        size = len(self._slots)
+        while self._current < last and self._pending:
+            self._current += 1
+            slot = self._slots[self._current % size]
+            if not slot:
+                continue
+            waiting, expired = [], []
+            for entry in slot:
+                if entry[0] > self._current:
+                    waiting.append(entry)
+                else:
+                    expired.append(entry)
+            self._slots[self._current % size] = waiting
+            self._pending -= len(expired)
+            expired.sort(key=_exact_deadline)
+            for _, _, future, result in expired:
+                if not future.done():
+                    future.set_result(result)
+        if self._pending:
+            self._schedule()
+        else:
+            self._handle = None
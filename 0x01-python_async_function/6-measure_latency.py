@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+
+"""
+Module: measure_latency
+
+This module contains a profiling counterpart of measure_time that reports
+how late tasks finish and how far the event loop falls behind, instead of a
+single average.
+
+Each task records the difference between the time it was due to complete,
+its creation time plus its random delay, and the time it actually completed.
+At the same time a sampler task sleeps in a loop and records how much later
+than requested it wakes up, which is the event loop lag. Both are measured
+with time.perf_counter_ns and stored in LatencyHistogram objects, which keep
+a bounded number of log-linear buckets, like an HDR histogram, so recording
+is O(1) and memory does not grow with n.
+
+Classes:
+    - LatencyHistogram(): Records non-negative integer values and reports
+      percentiles with about two significant digits of precision.
+    - LatencyReport: The structured result of profile_time.
+
+Functions:
+    - profile_time(n: int, max_delay: int, lag_interval: float = 0.001)
+    -> LatencyReport: Runs n wait_random tasks and profiles their latency
+    and the event loop lag.
+"""
+
+import asyncio
+from time import perf_counter_ns
+from typing import Dict, List, NamedTuple, Optional
+
+wait_random = __import__('0-basic_async_syntax').wait_random
+Sleep = __import__('0-basic_async_syntax').Sleep
+run_bounded = __import__('1-concurrent_coroutines').run_bounded
+
+SUB_BUCKET_BITS = 7
+"""
+Values are grouped into buckets that share their top SUB_BUCKET_BITS bits,
+so a bucket is at most 1/64 as wide as the values it holds.
+"""
+
+_HALF = 1 << (SUB_BUCKET_BITS - 1)
+
+
+def _bucket(value: int) -> int:
+    """
+    Return the index of the bucket that holds value.
+    """
+    if value < 2 * _HALF:
+        return value
+    shift = value.bit_length() - SUB_BUCKET_BITS
+    return shift * _HALF + (value >> shift)
+
+
+def _bucket_high(index: int) -> int:
+    """
+    Return the largest value held by the bucket at index.
+    """
+    if index < 2 * _HALF:
+        return index
+    shift = index // _HALF - 1
+    return ((index - shift * _HALF + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """
+    A histogram of non-negative integers, such as latencies in nanoseconds.
+
+    Attributes:
+    count (int): The number of recorded values.
+    total (int): The sum of the recorded values.
+    min (int): The smallest recorded value.
+    max (int): The largest recorded value.
+    """
+
+    def __init__(self) -> None:
+        self._counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    def record(self, value: int) -> None:
+        """
+        Record one value. Negative values are recorded as 0.
+
+        Parameters:
+        value (int): The value to record.
+        """
+        if value < 0:
+            value = 0
+        index = _bucket(value)
+        self._counts[index] = self._counts.get(index, 0) + 1
+        if not self.count or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.count += 1
+        self.total += value
+
+    def percentile(self, percent: float) -> int:
+        """
+        Return the value below or at which percent of the recorded values
+        fall, rounded up to the top of its bucket.
+
+        Parameters:
+        percent (float): A percentage between 0 and 100.
+
+        Returns:
+        int: The percentile, or 0 if nothing was recorded.
+        """
+        if not self.count:
+            return 0
+        rank = max(1, -(-self.count * percent // 100))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= rank:
+                return min(_bucket_high(index), self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Return the count, mean, min, p50, p99, p99.9 and max of the recorded
+        values.
+
+        Returns:
+        Dict[str, float]: The summary statistics.
+        """
+        return {
+            'count': self.count,
+            'mean': self.total / self.count if self.count else 0.0,
+            'min': self.min,
+            'p50': self.percentile(50),
+            'p99': self.percentile(99),
+            'p99.9': self.percentile(99.9),
+            'max': self.max,
+        }
+
+
+class LatencyReport(NamedTuple):
+    """
+    The result of profile_time. Times are in nanoseconds.
+
+    Attributes:
+    n (int): The number of tasks.
+    total_ns (int): The wall time of the whole run.
+    mean_per_task (float): total_ns / n in seconds, the value measure_time
+    returns.
+    latency (Dict[str, float]): The summary of how late each task completed
+    compared with its creation time plus its delay.
+    loop_lag (Dict[str, float]): The summary of how late the sampler woke up
+    compared with the interval it slept for.
+    """
+    n: int
+    total_ns: int
+    mean_per_task: float
+    latency: Dict[str, float]
+    loop_lag: Dict[str, float]
+
+
+async def _profile(n: int, max_delay: float, lag_interval: float,
+                   max_in_flight: Optional[int],
+                   sleep: Optional[Sleep]) -> LatencyReport:
+    """
+    Run the tasks and the lag sampler and return their report.
+    """
+    latency = LatencyHistogram()
+    loop_lag = LatencyHistogram()
+    interval_ns = int(lag_interval * 1e9)
+
+    async def timed(created: int) -> float:
+        delay = await wait_random(max_delay, sleep)
+        latency.record(perf_counter_ns() - created - int(delay * 1e9))
+        return delay
+
+    async def sample_lag() -> None:
+        while True:
+            start = perf_counter_ns()
+            await asyncio.sleep(lag_interval)
+            loop_lag.record(perf_counter_ns() - start - interval_ns)
+
+    sampler = asyncio.create_task(sample_lag())
+    start = perf_counter_ns()
+    try:
+        if max_in_flight is None:
+            spawn_ls: List[asyncio.Task] = [
+                asyncio.create_task(timed(perf_counter_ns()))
+                for _ in range(n)]
+            for spawn in spawn_ls:
+                await spawn
+        else:
+            await run_bounded(lambda: timed(perf_counter_ns()), n,
+                              max_in_flight)
+        total_ns = perf_counter_ns() - start
+    finally:
+        sampler.cancel()
+    return LatencyReport(n, total_ns, total_ns / 1e9 / n if n else 0.0,
+                         latency.summary(), loop_lag.summary())
+
+
+def profile_time(n: int, max_delay: int, lag_interval: float = 0.001, *,
+                 max_in_flight: Optional[int] = None,
+                 sleep: Optional[Sleep] = None) -> LatencyReport:
+    """
+    Run wait_random n times concurrently, like measure_time, and return a
+    latency and event loop lag profile of the run.
+
+    Parameters:
+    n (int): The number of times to spawn wait_random.
+    max_delay (int): The maximum number of seconds to wait for each call to
+    wait_random.
+    lag_interval (float): The number of seconds the lag sampler sleeps
+    between samples. Default is 0.001.
+    max_in_flight (Optional[int]): The maximum number of tasks running at
+    once, as for wait_n. Default is None, which runs all n at once.
+    sleep (Optional[Sleep]): The function wait_random sleeps with. Default
+    is None, which uses asyncio.sleep.
+
+    Returns:
+    LatencyReport: The total and average time, and the summaries of the
+    task latency and event loop lag histograms.
+    """
+    return asyncio.run(_profile(n, max_delay, lag_interval, max_in_flight,
+                                sleep))
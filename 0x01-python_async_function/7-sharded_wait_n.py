@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+
+"""
+Module: sharded_wait_n
+
+This module contains a runner that spreads wait_n over several processes so
+that a large n is not limited by a single event loop on a single core.
+
+The function sharded_wait_n splits n into one share per worker process. Each
+worker runs wait_n on its own event loop and sends its delays back as the raw
+bytes of an array('d'), which is far smaller to pickle than a list of floats.
+Each worker sorts its own delays, so the parent only has to merge the sorted
+shards with heapq.merge into one ascending list, as wait_n would return.
+
+Functions:
+    - sharded_wait_n(n: int, max_delay: int = 10, workers: int = None)
+    -> List[float]: Runs wait_n across worker processes and merges the
+    delays in ascending order.
+    - scaling_curve(n: int, max_delay: int = 10, max_workers: int = None)
+    -> List[Tuple[int, float]]: Times sharded_wait_n for 1 to max_workers
+    processes.
+"""
+
+import asyncio
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from heapq import merge
+from itertools import repeat
+from time import perf_counter
+from typing import List, Optional, Tuple
+
+wait_n = __import__('1-concurrent_coroutines').wait_n
+
+
+def _run_shard(share: int, max_delay: float,
+               max_in_flight: Optional[int]) -> bytes:
+    """
+    Run wait_n for one share in a worker process and return its delays,
+    sorted, as the bytes of an array('d').
+
+    wait_n returns delays in completion order, which can be slightly out of
+    order because each task starts its sleep a little later than the one
+    before; sorting here makes the shards safe to merge.
+    """
+    delays = asyncio.run(wait_n(share, max_delay,
+                                max_in_flight=max_in_flight))
+    return array('d', sorted(delays)).tobytes()
+
+
+def _shares(n: int, workers: int) -> List[int]:
+    """
+    Split n into workers nearly equal, non-empty shares.
+    """
+    workers = max(1, min(workers, n))
+    return [n // workers + (i < n % workers) for i in range(workers)]
+
+
+def sharded_wait_n(n: int, max_delay: int = 10,
+                   workers: Optional[int] = None, *,
+                   max_in_flight: Optional[int] = None) -> List[float]:
+    """
+    Run wait_n on one event loop per worker process and return all the
+    delays in ascending order.
+
+    Parameters:
+    n (int): The total number of times to spawn wait_random.
+    max_delay (int): The maximum number of seconds to wait for each call to
+    wait_random. Default is 10.
+    workers (Optional[int]): The number of worker processes. Default is
+    None, which uses os.cpu_count().
+    max_in_flight (Optional[int]): Passed on to wait_n in every worker.
+    Default is None.
+
+    Returns:
+    List[float]: The n delays in ascending order.
+    """
+    if n <= 0:
+        return []
+    shares = _shares(n, workers or os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=len(shares)) as executor:
+        blobs = list(executor.map(_run_shard, shares, repeat(max_delay),
+                                  repeat(max_in_flight)))
+    shards = []
+    for blob in blobs:
+        shard = array('d')
+        shard.frombytes(blob)
+        shards.append(shard)
+    return list(merge(*shards))
+
+
+def scaling_curve(n: int, max_delay: int = 10,
+                  max_workers: Optional[int] = None, *,
+                  max_in_flight: Optional[int] = None
+                  ) -> List[Tuple[int, float]]:
+    """
+    Time sharded_wait_n(n, max_delay) with 1, 2, ... max_workers processes.
+
+    Parameters:
+    n (int): The total number of times to spawn wait_random.
+    max_delay (int): The maximum number of seconds to wait for each call to
+    wait_random. Default is 10.
+    max_workers (Optional[int]): The largest number of processes tried.
+    Default is None, which uses os.cpu_count().
+    max_in_flight (Optional[int]): Passed on to wait_n in every worker.
+    Default is None.
+
+    Returns:
+    List[Tuple[int, float]]: The number of processes and the wall time in
+    seconds of each run, process start-up included.
+    """
+    curve = []
+    for workers in range(1, (max_workers or os.cpu_count() or 1) + 1):
+        start = perf_counter()
+        sharded_wait_n(n, max_delay, workers, max_in_flight=max_in_flight)
+        curve.append((workers, perf_counter() - start))
+    return curve
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+
+"""
+Module: virtual_time
+
+This module contains an event loop whose clock is simulated, so that code
+which sleeps for a long time finishes as soon as its CPU work is done.
+
+VirtualTimeLoop is a SelectorEventLoop whose time() reads a virtual clock
+starting at 0. Whenever the loop has nothing ready to run and would block
+until its next timer, it polls for I/O without blocking and, if there is
+none, moves the virtual clock forward to that timer's deadline instead of
+waiting. Timers fire in the same order and at the same loop times as on a
+real loop, so wait_n, task_wait_n, async_comprehension and both measure
+functions, which read the loop clock, report virtual timings. Waiting for
+I/O with no timer pending still blocks for real.
+
+Classes:
+    - VirtualTimeLoop(): An event loop running on a virtual clock.
+    - VirtualTimePolicy(): An event loop policy that creates
+      VirtualTimeLoop objects.
+
+Functions:
+    - virtual_time() -> ContextManager[None]: Makes asyncio.run, and so
+      measure_time, use a VirtualTimeLoop inside a with block.
+    - run_virtual(main: Awaitable[T]) -> T: Runs a coroutine to completion
+      on a VirtualTimeLoop.
+"""
+
+import asyncio
+import selectors
+from contextlib import contextmanager
+from typing import Coroutine, Iterator, Optional, TypeVar
+
+T = TypeVar('T')
+
+
+class _VirtualSelector(selectors.DefaultSelector):
+    """
+    A selector that advances a virtual clock instead of blocking until a
+    timeout.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.now = 0.0
+
+    def select(self, timeout: Optional[float] = None):
+        if timeout is None:
+            return super().select(None)
+        events = super().select(0)
+        if not events and timeout > 0:
+            self.now += timeout
+        return events
+
+
+class VirtualTimeLoop(asyncio.SelectorEventLoop):
+    """
+    A SelectorEventLoop whose clock only advances when the loop would
+    otherwise sleep until its next timer.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(_VirtualSelector())
+
+    def time(self) -> float:
+        """
+        Return the current virtual time, in seconds since the loop was
+        created.
+        """
+        return self._selector.now
+
+
+class VirtualTimePolicy(asyncio.DefaultEventLoopPolicy):
+    """
+    An event loop policy whose new event loops are VirtualTimeLoop objects.
+    """
+
+    def new_event_loop(self) -> VirtualTimeLoop:
+        return VirtualTimeLoop()
+
+
+@contextmanager
+def virtual_time() -> Iterator[None]:
+    """
+    Install VirtualTimePolicy for the duration of a with block, so that
+    asyncio.run, and functions built on it such as measure_time, run on a
+    VirtualTimeLoop.
+
+    Example Usage:
+    --------------
+    >>> with virtual_time():
+    ...     measure_time(1000, 10)
+    """
+    previous = asyncio.get_event_loop_policy()
+    asyncio.set_event_loop_policy(VirtualTimePolicy())
+    try:
+        yield
+    finally:
+        asyncio.set_event_loop_policy(previous)
+
+
+def run_virtual(main: Coroutine[None, None, T]) -> T:
+    """
+    Run a coroutine to completion on a new VirtualTimeLoop and return its
+    result, like asyncio.run.
+
+    Parameters:
+    main (Coroutine[None, None, T]): The coroutine to run.
+
+    Returns:
+    T: The value returned by the coroutine.
+
+    Example Usage:
+    --------------
+    >>> delays = run_virtual(wait_n(10 ** 5, 10))
+    """
+    with virtual_time():
+        return asyncio.run(main)
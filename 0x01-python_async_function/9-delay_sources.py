@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+
+"""
+Module: delay_sources
+
+This module contains delay sources: iterators of delays that wait_random can
+use instead of drawing `max_delay * random.random()` from the global random
+number generator on every call.
+
+Each source owns a private random.Random seeded from its own seed, and
+generates delays in batches of batch_size into an array('d'). A batch is
+built with chained map calls over the generator's C methods, so filling it
+runs no Python code per delay, and handing out a delay is an index into the
+array. spawn(worker) derives an independent, reproducible source for each
+worker of a load generator from the parent's seed.
+
+Classes:
+    - DelaySource(seed=None, batch_size=4096, cap=None): The abstract base
+      class.
+    - UniformDelays(max_delay=10, ...): Delays uniform in [0, max_delay),
+      like wait_random.
+    - ExponentialDelays(mean=1, ...): Exponentially distributed delays.
+    - ParetoDelays(alpha=1.5, scale=0.1, ...): Pareto distributed delays.
+    - TraceDelays(trace, ...): Delays replayed from a recorded trace.
+"""
+
+import copy
+import random
+from abc import ABC, abstractmethod
+from array import array
+from itertools import islice, repeat, starmap
+from math import log
+from operator import mul, sub
+from typing import Any, Iterable, Iterator, Optional, Sequence
+
+
+class DelaySource(ABC):
+    """
+    An infinite iterator of delays, in seconds, generated in batches.
+
+    Subclasses must implement _values(count), which returns an iterable of
+    count new delays and is called once per batch; DelaySource itself cannot
+    be instantiated.
+
+    Attributes:
+    seed (Any): The seed of this source's random number generator.
+    batch_size (int): The number of delays generated at a time.
+    cap (Optional[float]): The largest delay handed out; larger delays are
+    clipped to it.
+    """
+
+    def __init__(self, seed: Any = None, batch_size: int = 4096,
+                 cap: Optional[float] = None) -> None:
+        """
+        Parameters:
+        seed (Any): The seed of the random number generator. Default is
+        None, which seeds from the operating system.
+        batch_size (int): The number of delays generated at a time.
+        Default is 4096.
+        cap (Optional[float]): The largest delay handed out. Default is
+        None, which does not clip.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.seed = seed
+        self.batch_size = batch_size
+        self.cap = cap
+        self._reset()
+
+    def _reset(self) -> None:
+        """
+        Seed the random number generator and drop the current batch.
+        """
+        self._rng = random.Random(self.seed)
+        self._batch = array('d')
+        self._index = 0
+
+    def _uniforms(self, count: int) -> Iterator[float]:
+        """
+        Return count uniform values in [0, 1) from the generator.
+        """
+        return starmap(self._rng.random, repeat((), count))
+
+    @abstractmethod
+    def _values(self, count: int) -> Iterable[float]:
+        """
+        Return an iterable of count new delays, before clipping to cap.
+        """
+
+    def _refill(self) -> None:
+        """
+        Replace the exhausted batch with batch_size new delays.
+        """
+        values = self._values(self.batch_size)
+        if self.cap is not None:
+            values = map(min, values, repeat(self.cap))
+        self._batch = array('d', values)
+        self._index = 0
+
+    def __iter__(self) -> 'DelaySource':
+        return self
+
+    def __next__(self) -> float:
+        if self._index >= len(self._batch):
+            self._refill()
+        value = self._batch[self._index]
+        self._index += 1
+        return value
+
+    def take(self, count: int) -> array:
+        """
+        Return the next count delays as an array('d').
+
+        Parameters:
+        count (int): The number of delays.
+
+        Returns:
+        array: The delays, in the order __next__ would return them.
+        """
+        return array('d', islice(self, count))
+
+    def spawn(self, worker: int) -> 'DelaySource':
+        """
+        Return a source with the same distribution and an independent
+        generator derived from this source's seed and worker, so every
+        worker of a run draws different but reproducible delays.
+
+        Parameters:
+        worker (int): The worker number.
+
+        Returns:
+        DelaySource: The new source.
+        """
+        child = copy.copy(self)
+        if self.seed is None:
+            child.seed = None
+        else:
+            child.seed = "{}/{}".format(self.seed, worker)
+        child._reset()
+        return child
+
+
+class UniformDelays(DelaySource):
+    """
+    Delays uniformly distributed in [0, max_delay), the distribution
+    wait_random draws from.
+    """
+
+    def __init__(self, max_delay: float = 10, **options: Any) -> None:
+        """
+        Parameters:
+        max_delay (float): The upper bound of the delays. Default is 10.
+        options: The seed, batch_size and cap of DelaySource.
+        """
+        self.max_delay = max_delay
+        super().__init__(**options)
+
+    def _values(self, count: int) -> Iterable[float]:
+        return map(mul, self._uniforms(count), repeat(self.max_delay))
+
+
+class ExponentialDelays(DelaySource):
+    """
+    Exponentially distributed delays, the gaps between events of a Poisson
+    process, computed as -mean * log(1 - u).
+    """
+
+    def __init__(self, mean: float = 1, **options: Any) -> None:
+        """
+        Parameters:
+        mean (float): The mean delay. Default is 1.
+        options: The seed, batch_size and cap of DelaySource.
+        """
+        if mean <= 0:
+            raise ValueError("mean must be positive")
+        self.mean = mean
+        super().__init__(**options)
+
+    def _values(self, count: int) -> Iterable[float]:
+        complements = map(sub, repeat(1.0), self._uniforms(count))
+        return map(mul, map(log, complements), repeat(-self.mean))
+
+
+class ParetoDelays(DelaySource):
+    """
+    Pareto distributed delays with a heavy tail, computed as
+    scale * (1 - u) ** (-1 / alpha). Consider setting cap, since the tail
+    produces very long delays.
+    """
+
+    def __init__(self, alpha: float = 1.5, scale: float = 0.1,
+                 **options: Any) -> None:
+        """
+        Parameters:
+        alpha (float): The shape of the distribution; smaller values give a
+        heavier tail. Default is 1.5.
+        scale (float): The smallest delay. Default is 0.1.
+        options: The seed, batch_size and cap of DelaySource.
+        """
+        if alpha <= 0 or scale <= 0:
+            raise ValueError("alpha and scale must be positive")
+        self.alpha = alpha
+        self.scale = scale
+        super().__init__(**options)
+
+    def _values(self, count: int) -> Iterable[float]:
+        complements = map(sub, repeat(1.0), self._uniforms(count))
+        return map(mul, map(pow, complements, repeat(-1 / self.alpha)),
+                   repeat(self.scale))
+
+
+class TraceDelays(DelaySource):
+    """
+    Delays replayed, in order and cyclically, from a recorded trace. Each
+    spawned source starts at its own reproducible offset into the trace.
+    """
+
+    def __init__(self, trace: Sequence[float], **options: Any) -> None:
+        """
+        Parameters:
+        trace (Sequence[float]): The recorded delays.
+        options: The seed, batch_size and cap of DelaySource.
+        """
+        self.trace = array('d', trace)
+        if not self.trace:
+            raise ValueError("trace must not be empty")
+        self._offset = 0
+        super().__init__(**options)
+
+    def spawn(self, worker: int) -> 'TraceDelays':
+        child = super().spawn(worker)
+        child._offset = child._rng.randrange(len(self.trace))
+        return child
+
+    def _values(self, count: int) -> Iterable[float]:
+        values = array('d')
+        while len(values) < count:
+            end = min(self._offset + count - len(values), len(self.trace))
+            values.extend(self.trace[self._offset:end])
+            self._offset = end % len(self.trace)
+        return values
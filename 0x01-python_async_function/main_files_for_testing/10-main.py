@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+
+import asyncio
+import hashlib
+import time
+from functools import partial
+
+offload = __import__('10-offload')
+Offload = offload.Offload
+blocking_wait_random = offload.blocking_wait_random
+cpu_bound = offload.cpu_bound
+offload_n = offload.offload_n
+
+
+def hash_rounds(rounds: int) -> float:
+    """Hash a block rounds times and return the seconds it took."""
+    start = time.perf_counter()
+    digest = b'\0' * 64
+    for _ in range(rounds):
+        digest = hashlib.sha256(digest).digest()
+    return time.perf_counter() - start
+
+
+async def main() -> None:
+    jobs = [partial(blocking_wait_random, 1) for _ in range(8)]
+    jobs += [cpu_bound(hash_rounds, 200000) for _ in range(4)]
+    async with Offload(io_workers=8, cpu_workers=4) as pools:
+        start = time.perf_counter()
+        results = await offload_n(jobs, offload=pools)
+        print("{} jobs in {:.3f}s".format(
+            len(results), time.perf_counter() - start))
+        print(await offload_n(jobs[:5], offload=pools, max_in_flight=2))
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
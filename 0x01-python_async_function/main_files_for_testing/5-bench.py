@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+
+import asyncio
+import sys
+import time
+
+wait_n = __import__('1-concurrent_coroutines').wait_n
+TimingWheel = __import__('5-timing_wheel').TimingWheel
+
+# Usage: ./5-bench.py [max_delay] [n ...]
+max_delay = float(sys.argv[1]) if len(sys.argv) > 1 else 1
+sizes = [int(n) for n in sys.argv[2:]] or [10 ** 4, 10 ** 5, 10 ** 6]
+
+
+async def run(n, sleep):
+    start = time.perf_counter()
+    delays = await wait_n(n, max_delay, sleep=sleep)
+    assert len(delays) == n
+    return time.perf_counter() - start
+
+
+print("max_delay = {}s".format(max_delay))
+for n in sizes:
+    native = asyncio.run(run(n, None))
+    wheel = TimingWheel(tick=0.01)
+    wheeled = asyncio.run(run(n, wheel.sleep))
+    print("n = {:>8}: asyncio.sleep {:7.3f}s, TimingWheel {:7.3f}s "
+          "({} wakeups)".format(n, native, wheeled, wheel.wakeups))
@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+
+profile_time = __import__('6-measure_latency').profile_time
+
+max_delay = 1
+print("{:>7} | {:>31} | {:>31}".format(
+    "n", "task latency p50/p99/max (ms)", "loop lag p50/p99/max (ms)"))
+for n in (10, 1000, 10000, 100000):
+    report = profile_time(n, max_delay)
+    print("{:>7} | {:>9.2f} {:>10.2f} {:>10.2f} | {:>9.2f} {:>10.2f} {:>10.2f}"
+          .format(n, *(report.latency[key] / 1e6
+                       for key in ("p50", "p99", "max")),
+                  *(report.loop_lag[key] / 1e6
+                    for key in ("p50", "p99", "max"))))
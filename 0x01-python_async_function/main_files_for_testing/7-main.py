@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+
+scaling_curve = __import__('7-sharded_wait_n').scaling_curve
+
+
+def main():
+    # Usage: ./7-main.py [n] [max_delay]
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    max_delay = float(sys.argv[2]) if len(sys.argv) > 2 else 1
+
+    print("n = {}, max_delay = {}s, {} CPUs".format(
+        n, max_delay, os.cpu_count()))
+    baseline = None
+    for workers, seconds in scaling_curve(n, max_delay):
+        baseline = baseline or seconds
+        print("{:>3} processes: {:7.3f}s  speed-up {:.2f}x".format(
+            workers, seconds, baseline / seconds))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+
+import sys
+import time
+
+measure_time = __import__('2-measure_runtime').measure_time
+virtual_time = __import__('8-virtual_time').virtual_time
+
+# Usage: ./8-main.py [n] [max_delay]
+n = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 5
+max_delay = float(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+start = time.perf_counter()
+with virtual_time():
+    average = measure_time(n, max_delay)
+wall = time.perf_counter() - start
+print("n = {}, max_delay = {}s".format(n, max_delay))
+print("virtual time: {:.3f}s total, {:.9f}s per task".format(
+    average * n, average))
+print("wall time:    {:.3f}s".format(wall))
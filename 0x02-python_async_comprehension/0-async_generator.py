@@ -5,28 +5,80 @@ Module: async_generator
 
 This module contains a coroutine that generates random numbers asynchronously.
 
-The coroutine async_generator takes no arguments. It loops 10 times, each time
-asynchronously waiting for 1 second before yielding a random number between 0
-and 10.
+The coroutine async_generator loops `count` times, each time asynchronously
+waiting for `delay` seconds before yielding a random number between 0 and 10.
+By default it yields 10 numbers, one every second.
+
+At high rates the await and the __anext__ call behind every value cost more
+than the value itself, so async_generator_batched yields the values in
+chunks, waiting and resuming the consumer once per chunk instead of once per
+value.
 
 Functions:
-    - async_generator() -> Generator[float, None, None]: Asynchronously
-    generates random numbers between 0 and 10.
+    - async_generator(count: int = 10, delay: float = 1)
+    -> Generator[float, None, None]: Asynchronously generates random numbers
+    between 0 and 10.
+    - async_generator_batched(batch_size: int = 10, count: int = 10,
+    delay: float = 1, as_list: bool = False)
+    -> AsyncGenerator[Sequence[float], None]: Asynchronously generates
+    chunks of random numbers between 0 and 10.
 """
 
+from array import array
 from asyncio import sleep
+from functools import partial
+from itertools import repeat, starmap
+from operator import mul
 from random import random
-from typing import Generator
+from typing import AsyncGenerator, Generator, Sequence
 
 
-async def async_generator() -> Generator[float, None, None]:
+async def async_generator(count: int = 10,
+                          delay: float = 1) -> Generator[float, None, None]:
     """
-    Asynchronously generate a random number between 0 and 10 every second, for
-    a total of 10 numbers.
+    Asynchronously generate count random numbers between 0 and 10, waiting
+    delay seconds before each one. By default 10 numbers, one every second.
+
+    Parameters:
+    count (int): The number of values to generate. Default is 10.
+    delay (float): The number of seconds to wait before each value. Default
+    is 1.
 
     Yields:
     float: A random number between 0 and 10.
     """
-    for i in range(10):
-        await sleep(1)
+    for i in range(count):
+        await sleep(delay)
         yield 10 * random()
+
+
+async def async_generator_batched(
+        batch_size: int = 10, count: int = 10, delay: float = 1,
+        as_list: bool = False) -> AsyncGenerator[Sequence[float], None]:
+    """
+    Asynchronously generate count random numbers between 0 and 10 in chunks
+    of batch_size, waiting delay seconds before each chunk.
+
+    Each chunk is built by mapping over random without running Python code
+    per value. The last chunk is shorter when batch_size does not divide
+    count.
+
+    Parameters:
+    batch_size (int): The number of values per chunk. Default is 10.
+    count (int): The total number of values. Default is 10.
+    delay (float): The number of seconds to wait before each chunk. Default
+    is 1.
+    as_list (bool): Whether to yield lists instead of array('d'). Default is
+    False.
+
+    Yields:
+    Sequence[float]: A chunk of random numbers between 0 and 10.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    chunk_type = list if as_list else partial(array, 'd')
+    for start in range(0, count, batch_size):
+        size = min(batch_size, count - start)
+        await sleep(delay)
+        yield chunk_type(map(mul, starmap(random, repeat((), size)),
+                             repeat(10.0)))
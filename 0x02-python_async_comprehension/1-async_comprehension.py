@@ -10,14 +10,24 @@ The coroutine async_comprehension imports async_generator from a previous task
 and uses it to collect 10 random numbers using an asynchronous comprehension,
 then returns these 10 random numbers.
 
+The coroutine async_comprehension_batched collects the chunks of
+async_generator_batched instead, extending one array('d') per chunk so the
+values are copied in C rather than appended one at a time.
+
 Functions:
     - async_comprehension() -> List[float]: Collects 10 random numbers
     from async_generator and returns them as a list.
+    - async_comprehension_batched(batch_size: int = 10, count: int = 10,
+    delay: float = 1) -> List[float]: Collects the random numbers of
+    async_generator_batched and returns them as a flat list.
 """
 
+from array import array
 from typing import List
 
 async_generator = __import__('0-async_generator').async_generator
+async_generator_batched = __import__(
+    '0-async_generator').async_generator_batched
 
 
 async def async_comprehension() -> List[float]:
@@ -29,3 +39,24 @@ async def async_comprehension() -> List[float]:
     List[float]: A list of 10 random numbers.
     """
     return [value async for value in async_generator()]
+
+
+async def async_comprehension_batched(batch_size: int = 10, count: int = 10,
+                                      delay: float = 1) -> List[float]:
+    """
+    Collect the random numbers of async_generator_batched and return them as
+    a single flat list.
+
+    Parameters:
+    batch_size (int): The number of values per chunk. Default is 10.
+    count (int): The total number of values. Default is 10.
+    delay (float): The number of seconds to wait before each chunk. Default
+    is 1.
+
+    Returns:
+    List[float]: A list of count random numbers.
+    """
+    values = array('d')
+    async for chunk in async_generator_batched(batch_size, count, delay):
+        values.extend(chunk)
+    return values.tolist()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+
+"""
+Module: prefetch
+
+This module contains a wrapper that runs an asynchronous iterator ahead of
+its consumer.
+
+A plain async for asks the producer for the next value only once the
+consumer is done with the previous one, so the two take turns idling. The
+async generator prefetch moves the producer into a task that fills a
+bounded asyncio.Queue of up to k values while the consumer works, and waits
+for room in the queue whenever the consumer falls behind.
+
+An exception raised by the producer is passed through the queue and raised
+to the consumer after the values produced before it. When the consumer
+stops early, the producer task is cancelled and the wrapped iterator closed.
+
+Functions:
+    - prefetch(aiterable: AsyncIterable[T], k: int = 1)
+    -> AsyncIterator[T]: Yields the values of aiterable, produced up to k
+    values ahead.
+    - async_comprehension_prefetched(k: int = 10, count: int = 10,
+    delay: float = 1) -> List[float]: Collects the random numbers of
+    async_generator through prefetch.
+"""
+
+import asyncio
+from typing import AsyncIterable, AsyncIterator, List, TypeVar
+
+async_generator = __import__('0-async_generator').async_generator
+
+T = TypeVar('T')
+
+_DONE = object()
+
+
+class _Failure:
+    """
+    The exception the producer raised, queued behind its last value.
+    """
+
+    __slots__ = ('error',)
+
+    def __init__(self, error: Exception) -> None:
+        self.error = error
+
+
+async def prefetch(aiterable: AsyncIterable[T],
+                   k: int = 1) -> AsyncIterator[T]:
+    """
+    Yield the values of aiterable while a producer task fetches up to k of
+    the following values in the background.
+
+    Leaving the loop early cancels the producer. As with any async
+    generator, this happens when the generator is closed, so wrap it in
+    contextlib.aclosing to cancel the producer right away:
+
+        async with aclosing(prefetch(async_generator(), 4)) as values:
+            async for value in values:
+                if value > 9:
+                    break
+
+    Parameters:
+    aiterable (AsyncIterable[T]): The values to prefetch.
+    k (int): The maximum number of values fetched ahead of the consumer.
+    Default is 1.
+
+    Yields:
+    T: The values of aiterable, in order.
+    """
+    if k < 1:
+        raise ValueError("k must be at least 1")
+    buffer: asyncio.Queue = asyncio.Queue(k)
+
+    async def produce() -> None:
+        source = aiterable.__aiter__()
+        try:
+            async for value in source:
+                await buffer.put(value)
+        except Exception as error:
+            await buffer.put(_Failure(error))
+        else:
+            await buffer.put(_DONE)
+        finally:
+            aclose = getattr(source, 'aclose', None)
+            if aclose is not None:
+                await aclose()
+
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            value = await buffer.get()
+            if value is _DONE:
+                return
+            if isinstance(value, _Failure):
+                raise value.error
+            yield value
+    finally:
+        producer.cancel()
+        await asyncio.gather(producer, return_exceptions=True)
+
+
+async def async_comprehension_prefetched(k: int = 10, count: int = 10,
+                                         delay: float = 1) -> List[float]:
+    """
+    Collect the random numbers of async_generator, prefetched up to k values
+    ahead, and return them as a list.
+
+    Parameters:
+    k (int): The maximum number of values fetched ahead. Default is 10.
+    count (int): The number of values. Default is 10.
+    delay (float): The number of seconds async_generator waits before each
+    value. Default is 1.
+
+    Returns:
+    List[float]: A list of count random numbers.
+    """
+    return [value async for value in prefetch(async_generator(count, delay),
+                                              k)]
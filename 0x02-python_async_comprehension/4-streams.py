@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+
+"""
+Module: streams
+
+This module contains composable operators for asynchronous iterators, such
+as the output of async_generator.
+
+Writing a pipeline as nested async comprehensions gives every stage its own
+async generator, so each value passes through one __anext__ await per
+stage. A Stream instead fuses its synchronous stages into a single push
+chain: each stage is a plain function that hands its output straight to the
+next one, so the only await per value is the one on the source. Runs of
+consecutive map and filter stages share a single step that calls their
+functions in a row. A stage that needs to await, added with map_async,
+ends the chain and starts a new one behind it.
+
+Classes:
+    - Stream(source: AsyncIterable): A pipeline of map, filter, take,
+      window, batch, scan and map_async stages over source.
+
+Functions:
+    - stream(source: AsyncIterable) -> Stream: Starts a pipeline over
+      source.
+"""
+
+from collections import deque
+from typing import (Any, AsyncIterable, AsyncIterator, Awaitable, Callable,
+                    List, Tuple)
+
+Push = Callable[[Any], None]
+Flush = Callable[[], None]
+Step = Tuple[str, Callable]
+
+_MAP = 'map'
+_FILTER = 'filter'
+_STAGE = 'stage'
+_MISSING = object()
+
+
+class _Stop(Exception):
+    """
+    Raised through the push chain when a take stage has all its values.
+    """
+
+
+class Stream:
+    """
+    An asynchronous iterator built from a source and a sequence of stages.
+
+    Every operator returns a new Stream and leaves this one unchanged, but
+    the streams share their source, so only one of them should be iterated.
+
+    Maps and filters are kept as their functions, to be fused by _fuse.
+    Every other stage is a function that takes the push and flush functions
+    of the stage after it and returns its own. Push receives each value;
+    flush is called once at the end of the source so stages that hold
+    values, like batch, can pass them on.
+    """
+
+    __slots__ = ('_source', '_steps')
+
+    def __init__(self, source: AsyncIterable,
+                 steps: Tuple[Step, ...] = ()) -> None:
+        """
+        Parameters:
+        source (AsyncIterable): The values the stream starts from.
+        steps (Tuple[Step, ...]): The synchronous stages applied to them,
+        as (kind, function) pairs. Default is no stages.
+        """
+        self._source = source
+        self._steps = steps
+
+    def _then(self, kind: str, func: Callable) -> 'Stream':
+        return Stream(self._source, self._steps + ((kind, func),))
+
+    def map(self, func: Callable[[Any], Any]) -> 'Stream':
+        """
+        Return a stream of func(value) for each value.
+        """
+        return self._then(_MAP, func)
+
+    def filter(self, predicate: Callable[[Any], Any]) -> 'Stream':
+        """
+        Return a stream of the values for which predicate is true.
+        """
+        return self._then(_FILTER, predicate)
+
+    def take(self, count: int) -> 'Stream':
+        """
+        Return a stream of the first count values. The source is not read
+        further, and is closed, once they have been taken.
+        """
+        def stage(push: Push, flush: Flush) -> Tuple[Push, Flush]:
+            remaining = count
+            if remaining <= 0:
+                flush()
+                raise _Stop
+
+            def take(value: Any) -> None:
+                nonlocal remaining
+                push(value)
+                remaining -= 1
+                if remaining == 0:
+                    flush()
+                    raise _Stop
+            return take, flush
+        return self._then(_STAGE, stage)
+
+    def window(self, size: int) -> 'Stream':
+        """
+        Return a stream of tuples of size consecutive values, one for each
+        value from the size-th on, like a sliding window.
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1")
+
+        def stage(push: Push, flush: Flush) -> Tuple[Push, Flush]:
+            values: deque = deque(maxlen=size)
+
+            def slide(value: Any) -> None:
+                values.append(value)
+                if len(values) == size:
+                    push(tuple(values))
+            return slide, flush
+        return self._then(_STAGE, stage)
+
+    def batch(self, size: int) -> 'Stream':
+        """
+        Return a stream of lists of size values. The last list is shorter
+        when size does not divide the number of values.
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1")
+
+        def stage(push: Push, flush: Flush) -> Tuple[Push, Flush]:
+            chunk: List = []
+
+            def add(value: Any) -> None:
+                nonlocal chunk
+                chunk.append(value)
+                if len(chunk) == size:
+                    full, chunk = chunk, []
+                    push(full)
+
+            def flush_chunk() -> None:
+                nonlocal chunk
+                if chunk:
+                    rest, chunk = chunk, []
+                    push(rest)
+                flush()
+            return add, flush_chunk
+        return self._then(_STAGE, stage)
+
+    def scan(self, func: Callable[[Any, Any], Any],
+             initial: Any = _MISSING) -> 'Stream':
+        """
+        Return a stream of the running results of func, like
+        itertools.accumulate: func(total, value) for each value, starting
+        from initial, or from the first value when initial is omitted.
+        """
+        def stage(push: Push, flush: Flush) -> Tuple[Push, Flush]:
+            total = initial
+
+            def accumulate(value: Any) -> None:
+                nonlocal total
+                total = value if total is _MISSING else func(total, value)
+                push(total)
+            return accumulate, flush
+        return self._then(_STAGE, stage)
+
+    def map_async(self, func: Callable[[Any], Awaitable]) -> 'Stream':
+        """
+        Return a stream of await func(value) for each value. The stages
+        added before it form one fused chain and those added after it
+        another.
+        """
+        async def awaited() -> AsyncIterator:
+            async for value in self:
+                yield await func(value)
+        return Stream(awaited())
+
+    def _chain(self, push: Push) -> Tuple[Push, Flush]:
+        """
+        Fuse the stages into one push chain ending in push, and return the
+        push and flush functions of its first stage.
+        """
+        flush: Flush = _no_flush
+        steps = list(self._steps)
+        while steps:
+            kind, func = steps.pop()
+            if kind == _STAGE:
+                push, flush = func(push, flush)
+                continue
+            run = [(kind, func)]
+            while steps and steps[-1][0] != _STAGE:
+                run.append(steps.pop())
+            push = _fuse(run[::-1], push)
+        return push, flush
+
+    async def __aiter__(self) -> AsyncIterator:
+        """
+        Yield the values of the stream, reading the source one value at a
+        time and yielding whatever the fused stages produce from it.
+        """
+        out: List = []
+        source = self._source.__aiter__()
+        try:
+            try:
+                push, flush = self._chain(out.append)
+                async for value in source:
+                    push(value)
+                    if out:
+                        for result in out:
+                            yield result
+                        out.clear()
+                flush()
+            except _Stop:
+                pass
+            for result in out:
+                yield result
+        finally:
+            await _close(source)
+
+    async def collect(self) -> List:
+        """
+        Return all the values of the stream as a list. The fused stages
+        append to the list directly, without going through __aiter__.
+        """
+        results: List = []
+        source = self._source.__aiter__()
+        try:
+            push, flush = self._chain(results.append)
+            async for value in source:
+                push(value)
+            flush()
+        except _Stop:
+            pass
+        finally:
+            await _close(source)
+        return results
+
+
+def _fuse(run: List[Step], push: Push) -> Push:
+    """
+    Return one push function that applies a run of map and filter steps
+    in order and passes the surviving value to push.
+    """
+    steps = tuple((kind == _FILTER, func) for kind, func in run)
+
+    def fused(value: Any) -> None:
+        for is_filter, func in steps:
+            if is_filter:
+                if not func(value):
+                    return
+            else:
+                value = func(value)
+        push(value)
+    return fused
+
+
+def _no_flush() -> None:
+    """
+    The flush of the end of the chain, which holds nothing.
+    """
+
+
+async def _close(source: AsyncIterator) -> None:
+    """
+    Close source if it is an async generator, or has aclose like one.
+    """
+    aclose = getattr(source, 'aclose', None)
+    if aclose is not None:
+        await aclose()
+
+
+def stream(source: AsyncIterable) -> Stream:
+    """
+    Start a pipeline over source.
+
+    Parameters:
+    source (AsyncIterable): The values to transform, such as
+    async_generator().
+
+    Returns:
+    Stream: A stream with no stages, to add stages to.
+
+    Example Usage:
+    --------------
+        values = stream(async_generator(count=100, delay=0))
+        chunks = await (values.map(round).filter(lambda x: x > 2)
+                        .batch(10).collect())
+    """
+    return Stream(source)
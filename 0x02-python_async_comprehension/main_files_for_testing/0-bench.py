@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+
+import asyncio
+import sys
+import time
+
+async_comprehension = __import__('1-async_comprehension').async_comprehension
+async_generator = __import__('0-async_generator').async_generator
+async_comprehension_batched = __import__(
+    '1-async_comprehension').async_comprehension_batched
+
+# Usage: ./0-bench.py [count] [batch_size ...]
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 6
+batch_sizes = [int(size) for size in sys.argv[2:]] or [16, 256, 4096]
+
+
+async def per_item():
+    return [value async for value in async_generator(count, 0)]
+
+
+def items_per_second(coroutine):
+    start = time.perf_counter()
+    values = asyncio.run(coroutine)
+    assert len(values) == count
+    return count / (time.perf_counter() - start)
+
+
+print("count = {}, delay = 0".format(count))
+baseline = items_per_second(per_item())
+print("per item        {:12,.0f} items/s".format(baseline))
+for size in batch_sizes:
+    rate = items_per_second(async_comprehension_batched(size, count, 0))
+    print("batch {:>6}    {:12,.0f} items/s  {:6.1f}x".format(
+        size, rate, rate / baseline))
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+
+import asyncio
+import sys
+
+async_generator = __import__('0-async_generator').async_generator
+prefetch = __import__('3-prefetch').prefetch
+
+# Usage: ./3-main.py [count] [delay] [k]
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+delay = float(sys.argv[2]) if len(sys.argv) > 2 else 0.05
+k = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+
+
+async def consume(values):
+    total = 0.0
+    async for value in values:
+        await asyncio.sleep(delay)
+        total += value
+    return total
+
+
+async def main():
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    await consume(async_generator(count, delay))
+    plain = loop.time() - start
+    start = loop.time()
+    await consume(prefetch(async_generator(count, delay), k))
+    prefetched = loop.time() - start
+    print("count = {}, {}s to produce and {}s to consume each value".format(
+        count, delay, delay))
+    print("plain      {:.3f}s".format(plain))
+    print("prefetch {} {:.3f}s".format(k, prefetched))
+
+
+asyncio.run(main())
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+
+import asyncio
+import operator
+import sys
+import time
+
+stream = __import__('4-streams').stream
+
+# Usage: ./4-bench.py [count] [repeat]
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 6
+repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+
+def double(value):
+    return value * 2
+
+
+def kept(value):
+    return value % 3
+
+
+def shift(value):
+    return value + 1
+
+
+async def numbers(n):
+    for i in range(n):
+        yield i
+
+
+async def running(values):
+    total = 0
+    async for value in values:
+        total = operator.add(total, value)
+        yield total
+
+
+async def bare():
+    return [value async for value in numbers(count)]
+
+
+async def nested():
+    doubled = (double(value) async for value in numbers(count))
+    filtered = (value async for value in doubled if kept(value))
+    shifted = (shift(value) async for value in filtered)
+    return [total async for total in running(shifted)]
+
+
+def pipeline():
+    return (stream(numbers(count)).map(double).filter(kept).map(shift)
+            .scan(operator.add))
+
+
+async def fused_iter():
+    return [total async for total in pipeline()]
+
+
+async def fused_collect():
+    return await pipeline().collect()
+
+
+def per_item(main):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = asyncio.run(main())
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    return best / count * 1e9, result
+
+
+source, _ = per_item(bare)
+print("count = {}, map -> filter -> map -> scan, best of {}".format(
+    count, repeat))
+print("source alone           {:7.1f} ns/item".format(source))
+expected = None
+for name, main in (("nested comprehensions", nested),
+                   ("Stream, async for", fused_iter),
+                   ("Stream.collect", fused_collect)):
+    nanoseconds, result = per_item(main)
+    assert expected is None or result == expected
+    expected = result
+    print("{:<22} {:7.1f} ns/item, {:7.1f} over the source".format(
+        name, nanoseconds, nanoseconds - source))
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Package exposing the functions of this project under importable names.
+
+The project modules live in directories such as
+`0x01-python_async_function` and have names such as `1-concurrent_coroutines`,
+which cannot be imported with a normal `import` statement. This package maps
+every public name to the file that defines it and loads that file the first
+time the name is accessed, so only the modules a program actually uses, and
+their predecessors, are imported:
+
+    >>> from alx_backend_python import add, wait_n
+
+Modules are registered in `sys.modules` under their file name, so the
+`__import__('0-basic_async_syntax')` calls the modules make to load their
+predecessors find the module that is already loaded.
+
+To keep start-up cheap this file avoids importing `typing` and
+`importlib.util`, and annotates with built-in generic types instead.
+"""
+
+import importlib
+import os
+import sys
+from types import ModuleType
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_ANNOTATIONS = '0x00-python_variable_annotations'
+_ASYNC_FUNCTION = '0x01-python_async_function'
+_ASYNC_COMPREHENSION = '0x02-python_async_comprehension'
+
+_MODULES: dict[str, tuple[str, tuple[str, ...]]] = {
+    '0-add': (_ANNOTATIONS, ('add',)),
+    '1-concat': (_ANNOTATIONS, ('concat', 'Rope')),
+    '2-floor': (_ANNOTATIONS, ('floor',)),
+    '3-to_str': (_ANNOTATIONS, ('to_str', 'write_floats')),
+    '5-sum_list': (_ANNOTATIONS, ('sum_list', 'sum_buffer', 'sum_chunks')),
+    '6-sum_mixed_list': (_ANNOTATIONS, (
+        'sum_mixed_list', 'sum_mixed_buffer', 'sum_mixed_chunks')),
+    '7-to_kv': (_ANNOTATIONS, ('to_kv', 'to_kv_columns', 'KVColumns')),
+    '8-make_multiplier': (_ANNOTATIONS, ('make_multiplier', 'Multiplier')),
+    '9-element_length': (_ANNOTATIONS, (
+        'element_length', 'iter_element_length', 'element_lengths',
+        'element_length_columns', 'line_lengths')),
+    '100-safe_first_element': (_ANNOTATIONS, (
+        'safe_first_element', 'peek_first', 'apeek_first')),
+    '101-safely_get_value': (_ANNOTATIONS, (
+        'safely_get_value', 'safely_get_values', 'compile_path',
+        'safely_get_path', 'safely_get_paths')),
+    '102-type_checking': (_ANNOTATIONS, (
+        'zoom_array', 'zoom_view', 'zoom_into', 'ZoomView')),
+    '103-typechecked': (_ANNOTATIONS, ('typechecked', 'set_checking')),
+    '0-basic_async_syntax': (_ASYNC_FUNCTION, ('wait_random',)),
+    '1-concurrent_coroutines': (_ASYNC_FUNCTION, (
+        'wait_n', 'run_bounded', 'run_indexed', 'wait_n_as_completed')),
+    '2-measure_runtime': (_ASYNC_FUNCTION, ('measure_time',)),
+    '3-tasks': (_ASYNC_FUNCTION, ('task_wait_random',)),
+    '4-tasks': (_ASYNC_FUNCTION, (
+        'task_wait_n', 'task_wait_n_partial', 'PartialDelays')),
+    '5-timing_wheel': (_ASYNC_FUNCTION, ('TimingWheel',)),
+    '6-measure_latency': (_ASYNC_FUNCTION, (
+        'profile_time', 'LatencyHistogram', 'LatencyReport')),
+    '7-sharded_wait_n': (_ASYNC_FUNCTION, ('sharded_wait_n', 'scaling_curve')),
+    '8-virtual_time': (_ASYNC_FUNCTION, (
+        'VirtualTimeLoop', 'VirtualTimePolicy', 'virtual_time',
+        'run_virtual')),
+    '9-delay_sources': (_ASYNC_FUNCTION, (
+        'DelaySource', 'UniformDelays', 'ExponentialDelays', 'ParetoDelays',
+        'TraceDelays')),
+    '10-offload': (_ASYNC_FUNCTION, (
+        'offload_n', 'Offload', 'cpu_bound', 'blocking_wait_random')),
+    '11-rate_limit': (_ASYNC_FUNCTION, ('TokenBucket',)),
+    '0-async_generator': (_ASYNC_COMPREHENSION, (
+        'async_generator', 'async_generator_batched')),
+    '1-async_comprehension': (_ASYNC_COMPREHENSION, (
+        'async_comprehension', 'async_comprehension_batched')),
+    '2-measure_runtime@0x02': (_ASYNC_COMPREHENSION, ('measure_runtime',)),
+    '3-prefetch': (_ASYNC_COMPREHENSION, (
+        'prefetch', 'async_comprehension_prefetched')),
+    '4-streams': (_ASYNC_COMPREHENSION, ('stream', 'Stream')),
+}
+"""
+The project modules, keyed by file name, with the directory that holds
+each one and the names it exports. A suffix after `@` tells apart files
+that share a name in different directories.
+"""
+
+_EXPORTS: dict[str, str] = {
+    name: module for module, (_, names) in _MODULES.items()
+    for name in names
+}
+
+__all__: list[str] = sorted(_EXPORTS)
+
+
+def load_module(key: str) -> ModuleType:
+    """
+    Imports one project module and returns it.
+
+    The module's directory is added to `sys.path` so that its own
+    `__import__` calls resolve. A module whose file name is already taken in
+    `sys.modules` by a file from another directory is loaded under a name
+    private to this package instead.
+
+    Parameters:
+    key (str): A key of `_MODULES`, such as `'1-concurrent_coroutines'`.
+
+    Returns:
+    ModuleType: The imported module.
+    """
+    directory, _ = _MODULES[key]
+    stem = key.split('@')[0]
+    path = os.path.join(_ROOT, directory, stem + '.py')
+    module = sys.modules.get(stem)
+    if module is not None and getattr(module, '__file__', None) == path:
+        return module
+    directory = os.path.join(_ROOT, directory)
+    if directory not in sys.path:
+        sys.path.append(directory)
+    if module is None and not _shadowed(stem, directory):
+        return importlib.import_module(stem)
+    name = '{}._{}'.format(__name__, key.replace('-', '_').replace('@', '_'))
+    if name in sys.modules:
+        return sys.modules[name]
+    from importlib.util import module_from_spec, spec_from_file_location
+    spec = spec_from_file_location(name, path)
+    module = module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return module
+
+
+def _shadowed(stem: str, directory: str) -> bool:
+    """
+    Returns whether `import stem` would find a file from a directory earlier
+    on `sys.path` than `directory`.
+    """
+    for entry in sys.path:
+        entry = os.path.abspath(entry or os.curdir)
+        if entry == directory:
+            return False
+        if os.path.exists(os.path.join(entry, stem + '.py')):
+            return True
+    return True
+
+
+def __getattr__(name: str) -> object:
+    try:
+        key = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError("module {!r} has no attribute {!r}".format(
+            __name__, name)) from None
+    value = getattr(load_module(key), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Module for measuring the cold-start import cost of the project entry points.
+
+Each scenario runs in a fresh interpreter with `-X importtime`, the same
+instrumentation `python -X importtime` prints, and the per-module self times
+are added up. Scenarios compare loading an entry point through its chain of
+`__import__` calls from inside its directory with loading it through this
+package, and loading every module eagerly with loading one name lazily.
+
+Lazy loading only saves time when modules go unused. Loading one name
+through the package imports the same modules as its `__import__` chain,
+plus the package itself, so the two cost about the same; the saving shows
+against importing every module up front.
+
+Usage:
+    python3 -m alx_backend_python.importtime [--runs 5]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional, Sequence, Tuple
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_EAGER = '; '.join(
+    "sys.path.insert(0, {!r}); __import__({!r})".format(
+        os.path.join(_ROOT, directory), stem)
+    for directory, stem in (
+        ('0x00-python_variable_annotations', '0-add'),
+        ('0x00-python_variable_annotations', '5-sum_list'),
+        ('0x00-python_variable_annotations', '9-element_length'),
+        ('0x00-python_variable_annotations', '102-type_checking'),
+        ('0x01-python_async_function', '2-measure_runtime'),
+        ('0x01-python_async_function', '4-tasks'),
+    ))
+
+SCENARIOS: Dict[str, Tuple[str, str]] = {
+    'measure_time via __import__ chain': (
+        os.path.join(_ROOT, '0x01-python_async_function'),
+        "__import__('2-measure_runtime').measure_time"),
+    'measure_time via package': (
+        _ROOT, "from alx_backend_python import measure_time"),
+    'add via __import__': (
+        os.path.join(_ROOT, '0x00-python_variable_annotations'),
+        "__import__('0-add').add"),
+    'add via package': (_ROOT, "from alx_backend_python import add"),
+    'every module, eagerly': (_ROOT, "import sys; " + _EAGER),
+    'package import, no name used': (_ROOT, "import alx_backend_python"),
+}
+"""
+The scenarios measured: the working directory of each interpreter and the
+statement it runs.
+"""
+
+
+def import_time(cwd: str, statement: str) -> Tuple[int, List[str]]:
+    """
+    Runs `statement` in a fresh interpreter and returns its import cost.
+
+    Parameters:
+    cwd (str): The working directory of the interpreter, which is also the
+    first entry of its `sys.path`.
+    statement (str): The Python code to run.
+
+    Returns:
+    Tuple[int, List[str]]: The sum of the self import times in
+    microseconds, and the names of the modules imported.
+    """
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        cwd=cwd, stderr=subprocess.PIPE, stdout=subprocess.DEVNULL,
+        text=True, check=True)
+    total, modules = 0, []
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, _, name = line[len('import time:'):].split('|')
+        total += int(self_us)
+        modules.append(name.strip())
+    return total, modules
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Measures every scenario and prints the median import time of each.
+
+    Returns:
+    int: Always 0.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--runs', type=int, default=5,
+                        help='interpreters started per scenario (default: 5)')
+    args = parser.parse_args(argv)
+    print('{:<36} {:>12} {:>8}'.format('scenario', 'median', 'modules'))
+    for name, (cwd, statement) in SCENARIOS.items():
+        runs = [import_time(cwd, statement) for _ in range(args.runs)]
+        median = statistics.median(total for total, _ in runs)
+        print('{:<36} {:>9.2f} ms {:>8}'.format(
+            name, median / 1000, len(runs[0][1])))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())